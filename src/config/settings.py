@@ -151,6 +151,8 @@ class MNEMEConfig:
 
     # Year prefilter: narrow candidates before dense search
     use_year_prefilter: bool = True
+    # Storage precision for prefiltered dense scoring: "float32", "float16" or "int8"
+    dense_embedding_dtype: str = "float32"
 
     # Graph Expansion Settings (New)
     enable_graph_expansion: bool = True  # Expand results using graph neighbors
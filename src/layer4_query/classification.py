@@ -5,13 +5,16 @@ Classifies queries by type and intent.
 """
 
 import re
-from typing import Tuple
+from typing import List, Sequence, Tuple
 import logging
 
 from src.models.query import QueryType, QueryIntent
 
 logger = logging.getLogger(__name__)
 
+# Any mention of a year (1900s-2000s)
+_YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
+
 
 class QueryClassifier:
     """
@@ -162,6 +165,22 @@ class QueryClassifier:
 
         return best_type, confidence
 
+    def classify_types_batch(
+        self,
+        queries: Sequence[str],
+    ) -> List[Tuple[QueryType, float]]:
+        """
+        Classify the type of multiple queries.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            List of (QueryType, confidence) tuples, one per query
+        """
+        classify = self.classify_type
+        return [classify(query) for query in queries]
+
     def classify_intent(self, query: str) -> QueryIntent:
         """
         Classify query intent.
@@ -190,8 +209,7 @@ class QueryClassifier:
 
     def is_year_specific(self, query: str) -> bool:
         """Check if query mentions a specific year."""
-        year_pattern = re.compile(r"\b(19|20)\d{2}\b")
-        return bool(year_pattern.search(query))
+        return bool(_YEAR_PATTERN.search(query))
 
     def is_comparison_query(self, query: str) -> bool:
         """Check if query is a comparison query."""
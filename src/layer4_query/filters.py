@@ -5,13 +5,22 @@ Extracts year, category, and entity filters from queries.
 """
 
 import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 import logging
 
 from src.models.query import QueryFilters
 
 logger = logging.getLogger(__name__)
 
+# Cheap pre-check: every year pattern needs at least one ASCII digit
+_HAS_DIGIT = re.compile(r'[0-9]').search
+
+# Pulls the 4-digit year out of a full pattern match like "in 2021"
+_YEAR_DIGITS = re.compile(r'(?:19|20)\d{2}')
+
+# Quoted strings are treated as explicit entities
+_QUOTED = re.compile(r'"([^"]+)"')
+
 
 class FilterExtractor:
     """
@@ -34,6 +43,15 @@ class FilterExtractor:
         r'\bafter\s+(?:19|20)\d{2}\b',  # "after 2020"
     ]
 
+    # Patterns that mark the year as an explicit requirement
+    REQUIRED_YEAR_PATTERNS = [
+        r'\bonly\s+from\s+(?:19|20)\d{2}\b',
+        r'\bspecifically\s+in\s+(?:19|20)\d{2}\b',
+        r'\bexactly\s+in\s+(?:19|20)\d{2}\b',
+        r'\bfrom\s+(?:19|20)\d{2}\s+only\b',
+        r'\bin\s+(?:19|20)\d{2}\s+specifically\b',
+    ]
+
     # Category keywords matching personal knowledge base categories
     CATEGORY_KEYWORDS = {
         "ideas": [
@@ -74,6 +92,9 @@ class FilterExtractor:
             re.compile(p, re.IGNORECASE)
             for p in (year_patterns or self.DEFAULT_YEAR_PATTERNS)
         ]
+        self._required_year_patterns = [
+            re.compile(p, re.IGNORECASE) for p in self.REQUIRED_YEAR_PATTERNS
+        ]
         self.category_keywords = category_keywords or self.CATEGORY_KEYWORDS
 
     def extract(self, query: str) -> QueryFilters:
@@ -110,6 +131,19 @@ class FilterExtractor:
 
         return filters
 
+    def extract_batch(self, queries: Sequence[str]) -> List[QueryFilters]:
+        """
+        Extract filters from multiple queries.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            List of QueryFilters objects, one per query
+        """
+        extract = self.extract
+        return [extract(query) for query in queries]
+
     def _extract_year(self, query: str) -> Tuple[Optional[int], Optional[tuple]]:
         """
         Extract year or year range from query.
@@ -120,6 +154,10 @@ class FilterExtractor:
         Returns:
             Tuple of (single_year, year_range)
         """
+        if not _HAS_DIGIT(query):
+            logger.debug(f"No years found in query: '{query}'")
+            return None, None
+
         years_found = []
 
         for pattern in self.year_patterns:
@@ -128,7 +166,7 @@ class FilterExtractor:
                 full_match = match.group()  # Gets the full match like "2021" or "in 2021"
 
                 # Extract the 4-digit year from the match
-                year_search = re.search(r'(?:19|20)\d{2}', full_match)
+                year_search = _YEAR_DIGITS.search(full_match)
                 if year_search:
                     year = int(year_search.group())
                     if 1990 <= year <= 2030:
@@ -152,20 +190,10 @@ class FilterExtractor:
 
     def _is_year_required(self, query: str) -> bool:
         """Check if year is explicitly required in query."""
-        # Use non-capturing groups for consistency
-        required_patterns = [
-            r'\bonly\s+from\s+(?:19|20)\d{2}\b',
-            r'\bspecifically\s+in\s+(?:19|20)\d{2}\b',
-            r'\bexactly\s+in\s+(?:19|20)\d{2}\b',
-            r'\bfrom\s+(?:19|20)\d{2}\s+only\b',
-            r'\bin\s+(?:19|20)\d{2}\s+specifically\b',
-        ]
-
-        for pattern in required_patterns:
-            if re.search(pattern, query, re.IGNORECASE):
-                return True
+        if not _HAS_DIGIT(query):
+            return False
 
-        return False
+        return any(p.search(query) for p in self._required_year_patterns)
 
     def _extract_category(self, query: str) -> Optional[str]:
         """Extract category from query based on keywords."""
@@ -191,7 +219,7 @@ class FilterExtractor:
         entities = []
 
         # Look for quoted strings
-        quoted = re.findall(r'"([^"]+)"', query)
+        quoted = _QUOTED.findall(query)
         entities.extend(quoted)
 
         # Look for capitalized phrases (potential names/concepts)
@@ -15,12 +15,14 @@ from .difficulty import DifficultyClassifier, QueryDifficulty
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class RoutingDecision:
     """
     Routing decision for a query.
 
     Contains the classified difficulty and recommended retrieval parameters.
+    Frozen, since AdaptiveRouter hands out the same instance for every
+    query in a routing state.
     """
 
     difficulty: QueryDifficulty
@@ -80,6 +82,37 @@ class AdaptiveRouter:
         """
         self.classifier = classifier or DifficultyClassifier()
 
+        # Decisions per (query_type, difficulty, has_year_filter), resolved
+        # once from this router's tables
+        self._decisions: Dict[Tuple[QueryType, QueryDifficulty, bool], RoutingDecision] = {
+            (query_type, difficulty, has_year_filter): self._make_decision(
+                query_type, difficulty, has_year_filter
+            )
+            for query_type in QueryType
+            for difficulty in QueryDifficulty
+            for has_year_filter in (False, True)
+        }
+
+    def _make_decision(
+        self,
+        query_type: QueryType,
+        difficulty: QueryDifficulty,
+        has_year_filter: bool,
+    ) -> RoutingDecision:
+        """Resolve document limits and pre-filter range for one routing state."""
+        # Look up document limits
+        min_docs, max_docs = self.ROUTING_TABLE.get((query_type, difficulty), self.DEFAULT_LIMITS)
+
+        # Determine year pre-filter range
+        year_prefilter_range = self.YEAR_PREFILTER_RANGE if has_year_filter else 0
+
+        return RoutingDecision(
+            difficulty=difficulty,
+            min_docs=min_docs,
+            max_docs=max_docs,
+            year_prefilter_range=year_prefilter_range,
+        )
+
     def route(self, plan: QueryPlan) -> RoutingDecision:
         """
         Route a query plan to appropriate retrieval parameters.
@@ -93,28 +126,16 @@ class AdaptiveRouter:
         # Classify difficulty
         difficulty = self.classifier.classify(plan)
 
-        # Look up document limits
-        key = (plan.query_type, difficulty)
-        min_docs, max_docs = self.ROUTING_TABLE.get(key, self.DEFAULT_LIMITS)
-
-        # Determine year pre-filter range
-        if plan.filters.year_filter is not None:
-            year_prefilter_range = self.YEAR_PREFILTER_RANGE
-        else:
-            year_prefilter_range = 0
-
-        decision = RoutingDecision(
-            difficulty=difficulty,
-            min_docs=min_docs,
-            max_docs=max_docs,
-            year_prefilter_range=year_prefilter_range,
-        )
+        # Look up the precomputed decision for this routing state
+        decision = self._decisions[
+            (plan.query_type, difficulty, plan.filters.year_filter is not None)
+        ]
 
         logger.debug(
             f"Routing decision: type={plan.query_type.value}, "
             f"difficulty={difficulty.value}, "
-            f"docs={min_docs}-{max_docs}, "
-            f"year_prefilter={year_prefilter_range}"
+            f"docs={decision.min_docs}-{decision.max_docs}, "
+            f"year_prefilter={decision.year_prefilter_range}"
         )
 
         return decision
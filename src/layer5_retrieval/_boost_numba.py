@@ -0,0 +1,161 @@
+"""
+Boosting Kernel
+
+JIT-compiled scoring kernel used by HybridRRFStrategy._apply_boosting.
+
+Uses numba when installed; otherwise falls back to an equivalent NumPy
+implementation so numba stays an optional dependency.
+"""
+
+from typing import Tuple
+import logging
+import types
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    _NUMBA_AVAILABLE = False
+
+
+def _boost_numpy(
+    blended, dense, temporal, trust_penalty, year_weight, category_matched,
+    year_boost, category_boost, threshold, multiplicative,
+    out_final, out_year_boost, out_category_boost,
+):
+    """NumPy fallback with the same contract as the numba kernel."""
+    # Fold the threshold into the match masks so boosts are a plain multiply
+    above = dense >= threshold
+    np.multiply(year_weight * above, year_boost, out=out_year_boost)
+    np.multiply(category_matched & above, category_boost, out=out_category_boost)
+
+    if multiplicative:
+        out_final[:] = (
+            blended *
+            (1.0 + out_year_boost) *
+            (1.0 + out_category_boost) *
+            temporal *
+            trust_penalty
+        )
+    else:
+        out_final[:] = (
+            (blended + out_year_boost + out_category_boost) *
+            temporal *
+            trust_penalty
+        )
+
+
+# Below this many candidates, thread startup costs more than prange saves
+PARALLEL_THRESHOLD = 10_000
+
+
+if _NUMBA_AVAILABLE:
+    def _boost_loop(
+        blended, dense, temporal, trust_penalty, year_weight, category_matched,
+        year_boost, category_boost, threshold, multiplicative,
+        out_final, out_year_boost, out_category_boost,
+    ):
+        """Single pass over candidates: gate by threshold, boost, decay."""
+        n = blended.shape[0]
+        # Each iteration writes only its own out_* slot: no reductions needed
+        for i in numba.prange(n):
+            above = dense[i] >= threshold
+            yb = year_boost * year_weight[i] * above
+            cb = category_boost * (category_matched[i] and above)
+            out_year_boost[i] = yb
+            out_category_boost[i] = cb
+
+            if multiplicative:
+                out_final[i] = (
+                    blended[i] * (1.0 + yb) * (1.0 + cb) *
+                    temporal[i] * trust_penalty[i]
+                )
+            else:
+                out_final[i] = (
+                    (blended[i] + yb + cb) * temporal[i] * trust_penalty[i]
+                )
+
+    # numba keys its on-disk cache by function name, not compile flags, so
+    # the parallel build needs its own function or the serial dispatcher
+    # would load it from a warm cache
+    _boost_loop_parallel = types.FunctionType(
+        _boost_loop.__code__, _boost_loop.__globals__, "_boost_loop_parallel"
+    )
+    _boost_loop_parallel.__qualname__ = "_boost_loop_parallel"
+
+    # prange runs as a plain range loop when parallel=False
+    # No fastmath: it lets LLVM assume scores are never NaN, which would
+    # leave the threshold comparison undefined for NaN inputs
+    _boost_kernel_serial = numba.njit(cache=True)(_boost_loop)
+    _boost_kernel_parallel = numba.njit(cache=True, parallel=True)(_boost_loop_parallel)
+else:
+    _boost_kernel_serial = _boost_kernel_parallel = _boost_numpy
+
+
+def boost_scores(
+    blended: np.ndarray,
+    dense: np.ndarray,
+    temporal: np.ndarray,
+    trust_penalty: np.ndarray,
+    year_weight: np.ndarray,
+    category_matched: np.ndarray,
+    year_boost: float,
+    category_boost: float,
+    threshold: float,
+    multiplicative: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute boosted final scores for a candidate set.
+
+    Args:
+        blended: Base (blended or RRF) scores, float64
+        dense: Dense similarity scores, float64
+        temporal: Temporal decay weights, float64
+        trust_penalty: Trust penalty multipliers, float64
+        year_weight: Share of year_boost per candidate (0..1), float64
+        category_matched: Category match mask, bool
+        year_boost: Boost applied on year match
+        category_boost: Boost applied on category match
+        threshold: Min dense score for any boost to apply
+        multiplicative: True for blended mode, False for additive RRF mode
+
+    Returns:
+        Tuple of (final_scores, applied_year_boost, applied_category_boost)
+    """
+    n = blended.shape[0]
+    out_final = np.empty(n, dtype=np.float64)
+    out_year_boost = np.empty(n, dtype=np.float64)
+    out_category_boost = np.empty(n, dtype=np.float64)
+
+    kernel = _boost_kernel_parallel if n > PARALLEL_THRESHOLD else _boost_kernel_serial
+    kernel(
+        blended, dense, temporal, trust_penalty, year_weight, category_matched,
+        float(year_boost), float(category_boost), float(threshold), bool(multiplicative),
+        out_final, out_year_boost, out_category_boost,
+    )
+
+    return out_final, out_year_boost, out_category_boost
+
+
+_warmed_up = False
+
+
+def warmup() -> None:
+    """
+    Compile (or load from the on-disk cache) the serial kernel once per
+    process so the first query doesn't pay for it. The parallel kernel is
+    loaded on first use above PARALLEL_THRESHOLD.
+    """
+    global _warmed_up
+    if _warmed_up or not _NUMBA_AVAILABLE:
+        return
+
+    ones = np.ones(1, dtype=np.float64)
+    boost_scores(ones, ones, ones, ones, ones, np.ones(1, dtype=bool), 0.5, 0.2, 0.3, True)
+
+    _warmed_up = True
+    logger.debug("Boosting kernel compiled with numba")
@@ -118,6 +118,7 @@ class RetrievalEngine:
             enable_trust_filtering=self.config.enable_trust_filtering,
             user_confirmation_weight=self.config.user_confirmation_weight,
             source_reliability_weight=self.config.source_reliability_weight,
+            embedding_dtype=self.config.dense_embedding_dtype,
         )
 
     def _build_year_index(self) -> dict:
@@ -5,7 +5,6 @@ Pre-filters chunks by year before dense retrieval for efficiency.
 """
 
 from typing import List, Tuple, Dict
-from collections import defaultdict
 import logging
 import numpy as np
 
@@ -20,6 +19,8 @@ class YearPrefilter:
 
     Builds an index mapping years to chunk indices for fast lookup,
     enabling efficient year-based filtering before expensive embedding search.
+    Only chunk years are needed, so they are kept as a compact int32 array
+    alongside the chunk list.
     """
 
     def __init__(self, chunks: List[Chunk]):
@@ -30,21 +31,35 @@ class YearPrefilter:
             chunks: List of all chunks in corpus
         """
         self.chunks = chunks
+        self._years = np.fromiter(
+            (c.year if c.year is not None else -1 for c in chunks),
+            dtype=np.int32, count=len(chunks),
+        )
+
+        # Chunk indices ordered by year: every year range is one contiguous slice
+        self._sort_perm = np.argsort(self._years, kind="stable").astype(np.int32)
+        self._sort_perm.setflags(write=False)
+        self._sorted_years = self._years[self._sort_perm]
+
         self._year_to_indices = self._build_year_index()
+        self._unique_years = np.array(sorted(self._year_to_indices), dtype=np.int64)
 
         logger.debug(
             f"Built year prefilter index for {len(chunks)} chunks, "
             f"{len(self._year_to_indices)} unique years"
         )
 
-    def _build_year_index(self) -> Dict[int, List[int]]:
-        """Build index mapping years to chunk indices."""
-        index = defaultdict(list)
+    def _build_year_index(self) -> Dict[int, np.ndarray]:
+        """Build index mapping years to chunk index arrays (slices of the sort permutation)."""
+        years, starts = np.unique(self._sorted_years, return_index=True)
+        ends = np.append(starts[1:], len(self._sorted_years))
 
-        for i, chunk in enumerate(self.chunks):
-            index[chunk.year].append(i)
-
-        return dict(index)
+        # -1 marks chunks without a year; they never match a year filter
+        return {
+            int(year): self._sort_perm[start:end]
+            for year, start, end in zip(years, starts, ends)
+            if year >= 0
+        }
 
     def get_candidate_indices(
         self,
@@ -61,18 +76,7 @@ class YearPrefilter:
         Returns:
             List of chunk indices matching the year filter
         """
-        if not self.chunks:
-            return []
-
-        # Calculate year range
-        min_year = year_filter - range_size
-        max_year = year_filter + range_size
-
-        # Collect indices for all years in range
-        indices = []
-        for year in range(min_year, max_year + 1):
-            if year in self._year_to_indices:
-                indices.extend(self._year_to_indices[year])
+        indices = self._candidate_array(year_filter, range_size).tolist()
 
         logger.debug(
             f"Year prefilter: filter={year_filter}, range=±{range_size}, "
@@ -81,6 +85,16 @@ class YearPrefilter:
 
         return indices
 
+    def _candidate_array(self, year_filter: int, range_size: int) -> np.ndarray:
+        """Candidate chunk indices for a year range as a read-only int32 array."""
+        # Two binary searches bound the range in the year-sorted permutation
+        min_year = max(year_filter - range_size, 0)
+        max_year = year_filter + range_size
+        lo = np.searchsorted(self._sorted_years, min_year, side="left")
+        hi = np.searchsorted(self._sorted_years, max_year, side="right")
+
+        return self._sort_perm[lo:hi]
+
     def filter_embeddings(
         self,
         embeddings: np.ndarray,
@@ -108,8 +122,9 @@ class YearPrefilter:
             empty_embeddings = np.zeros((0, embeddings.shape[1]), dtype=embeddings.dtype)
             return empty_embeddings, []
 
-        # Extract embeddings for candidates
-        filtered_embeddings = embeddings[candidate_indices]
+        # Gather candidate rows in one contiguous pass
+        idx = np.asarray(candidate_indices, dtype=np.intp)
+        filtered_embeddings = np.take(embeddings, idx, axis=0)
 
         logger.debug(
             f"Filtered embeddings: {embeddings.shape[0]} → {filtered_embeddings.shape[0]} "
@@ -118,6 +133,18 @@ class YearPrefilter:
 
         return filtered_embeddings, candidate_indices
 
+    def years_of(self, indices) -> np.ndarray:
+        """
+        Get the years of chunks at the given indices.
+
+        Args:
+            indices: Chunk indices (list or array)
+
+        Returns:
+            int32 array of years, -1 for chunks without a year
+        """
+        return np.take(self._years, np.asarray(indices, dtype=np.intp))
+
     def get_years_in_range(
         self,
         year_filter: int,
@@ -136,14 +163,12 @@ class YearPrefilter:
         min_year = year_filter - range_size
         max_year = year_filter + range_size
 
-        return sorted([
-            year for year in self._year_to_indices.keys()
-            if min_year <= year <= max_year
-        ])
+        lo, hi = np.searchsorted(self._unique_years, [min_year, max_year + 1])
+        return self._unique_years[lo:hi].tolist()
 
     def get_available_years(self) -> List[int]:
         """Get all years with data."""
-        return sorted(self._year_to_indices.keys())
+        return self._unique_years.tolist()
 
     def get_chunk_count_by_year(self) -> Dict[int, int]:
         """Get count of chunks for each year."""
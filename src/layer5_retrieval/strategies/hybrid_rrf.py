@@ -24,9 +24,10 @@ Both modes:
 """
 
 import time
-import math
+import functools
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator, Union
 import logging
 import numpy as np
 
@@ -35,10 +36,106 @@ from src.models.chunk import Chunk
 from src.models.query import QueryPlan, QueryType
 from src.models.retrieval import RetrievalResult, ScoredChunk, RetrievalConfidence
 from src.layer2_graph.similarity.base import BaseSimilarityEngine
+from src.layer5_retrieval._boost_numba import boost_scores, warmup as warmup_boost_kernel
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class BoostedResults:
+    """
+    Boosted candidates stored as parallel arrays.
+
+    _apply_boosting returns them sorted by final score.
+
+    Holds one array per ScoredChunk field instead of one object per
+    candidate. Indexing or iterating materializes ScoredChunk objects
+    lazily (and caches them), so only the candidates a caller actually
+    touches - typically the top-k - are ever allocated.
+    """
+
+    chunks: List[Chunk]  # Full corpus; chunk_indices point into it
+    chunk_indices: np.ndarray
+    vector_scores: np.ndarray
+    bm25_scores: np.ndarray
+    combined_scores: np.ndarray
+    blended_scores: np.ndarray
+    final_scores: np.ndarray
+    year_boosts: np.ndarray
+    category_boosts: np.ndarray
+    temporal_weights: np.ndarray
+    trust_scores: np.ndarray
+    year_matched: np.ndarray
+    category_matched: np.ndarray
+    _materialized: List[Optional[ScoredChunk]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._materialized = [None] * len(self.chunk_indices)
+
+    @classmethod
+    def empty(cls, chunks: List[Chunk]) -> "BoostedResults":
+        """Results with no candidates."""
+        floats = np.zeros(0, dtype=np.float64)
+        bools = np.zeros(0, dtype=bool)
+        return cls(
+            chunks, np.zeros(0, dtype=np.intp),
+            floats, floats, floats, floats, floats, floats, floats, floats, floats,
+            bools, bools,
+        )
+
+    def take(self, positions: np.ndarray) -> "BoostedResults":
+        """New results holding the candidates at positions, in that order."""
+        return BoostedResults(
+            chunks=self.chunks,
+            chunk_indices=self.chunk_indices[positions],
+            vector_scores=self.vector_scores[positions],
+            bm25_scores=self.bm25_scores[positions],
+            combined_scores=self.combined_scores[positions],
+            blended_scores=self.blended_scores[positions],
+            final_scores=self.final_scores[positions],
+            year_boosts=self.year_boosts[positions],
+            category_boosts=self.category_boosts[positions],
+            temporal_weights=self.temporal_weights[positions],
+            trust_scores=self.trust_scores[positions],
+            year_matched=self.year_matched[positions],
+            category_matched=self.category_matched[positions],
+        )
+
+    def __len__(self) -> int:
+        return len(self.chunk_indices)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[ScoredChunk, List[ScoredChunk]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        if i < 0:
+            i += len(self)
+        scored = self._materialized[i]
+        if scored is None:
+            scored = ScoredChunk(
+                chunk=self.chunks[self.chunk_indices[i]],
+                vector_score=float(self.vector_scores[i]),
+                bm25_score=float(self.bm25_scores[i]),
+                combined_score=float(self.combined_scores[i]),
+                blended_score=float(self.blended_scores[i]),
+                final_score=float(self.final_scores[i]),
+                year_boost=float(self.year_boosts[i]),
+                category_boost=float(self.category_boosts[i]),
+                year_matched=bool(self.year_matched[i]),
+                category_matched=bool(self.category_matched[i]),
+                temporal_weight=float(self.temporal_weights[i]),
+                trust_score=float(self.trust_scores[i]),
+            )
+            self._materialized[i] = scored
+        return scored
+
+    def __iter__(self) -> Iterator[ScoredChunk]:
+        for i in range(len(self)):
+            yield self[i]
+
+
 class HybridRRFStrategy(BaseRetrievalStrategy):
     """
     Hybrid retrieval combining dense and sparse search.
@@ -78,6 +175,8 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
         enable_trust_filtering: bool = True,
         user_confirmation_weight: float = 0.6,
         source_reliability_weight: float = 0.4,
+        # Storage precision for prefiltered dense scoring
+        embedding_dtype: str = "float32",
     ):
         """
         Initialize hybrid RRF strategy.
@@ -102,6 +201,9 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
             enable_trust_filtering: Whether to filter by trust
             user_confirmation_weight: Weight for user confirmation (paper: 0.6)
             source_reliability_weight: Weight for source reliability (paper: 0.4)
+            embedding_dtype: "float32", "float16" or "int8" storage for the
+                embeddings used by prefiltered dense scoring. Quantized modes
+                release the float32 matrix (self.embeddings becomes None).
         """
         super().__init__(chunks, embeddings)
 
@@ -133,6 +235,26 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
         # Build BM25 index
         self._build_bm25_index()
 
+        # Per-chunk boosting inputs, gathered by index in _apply_boosting.
+        # Match masks depend only on the plan's (years, category), so they
+        # are memoized per strategy across re-ranking passes.
+        self._match_masks = functools.lru_cache(maxsize=16)(self._compute_match_masks)
+        self._build_chunk_arrays()
+
+        # Optionally quantized embeddings for prefiltered search
+        self.embedding_dtype = embedding_dtype
+        self._dense_codes, self._dense_scales = self._quantize_embeddings()
+        if self.embedding_dtype == "float32":
+            # The codes are the embeddings: keep one matrix, not two
+            self.embeddings = self._dense_codes
+        else:
+            # Keep only the quantized copy so the memory saving is real
+            self.embeddings = None
+
+        # Pay the boosting kernel's JIT (or cache load) cost once up front
+        # rather than on first query
+        warmup_boost_kernel()
+
     def _build_bm25_index(self):
         """
         Build BM25 index for sparse retrieval with improved tokenization.
@@ -157,6 +279,159 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
             self._bm25 = None
             self._bm25_available = False
 
+    def _build_chunk_arrays(self):
+        """
+        Precompute per-chunk boosting inputs as contiguous arrays.
+
+        - _years: int32 year, -1 when missing
+        - _categories: int16 code into _category_codes
+        - _doc_ordinals: ordinal of the July 1 document timestamp used for
+          temporal decay, -1 when the year is invalid
+        - _trust_scores: static trust score per chunk (paper S3, S7)
+        """
+        n = len(self.chunks)
+
+        self._years = np.fromiter(
+            (c.year if c.year is not None else -1 for c in self.chunks),
+            dtype=np.int32, count=n,
+        )
+
+        self._category_codes: Dict[str, int] = {}
+        self._categories = np.fromiter(
+            (self._category_codes.setdefault(c.category, len(self._category_codes))
+             for c in self.chunks),
+            dtype=np.int16, count=n,
+        )
+
+        def doc_ordinal(year) -> int:
+            try:
+                return datetime(year, 7, 1).toordinal()
+            except (ValueError, TypeError):
+                return -1
+
+        self._doc_ordinals = np.fromiter(
+            (doc_ordinal(c.year) for c in self.chunks), dtype=np.int64, count=n,
+        )
+        self._trust_scores = np.fromiter(
+            (self._compute_trust_score(c) for c in self.chunks),
+            dtype=np.float64, count=n,
+        )
+
+        # Cached masks were computed from the previous arrays
+        self._match_masks.cache_clear()
+
+    def _compute_match_masks(
+        self,
+        min_year: Optional[int],
+        year_weights: Tuple[float, ...],
+        category_filter: Optional[str],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute corpus-wide year boost weights and category match mask.
+
+        Year weights are a single gather from the plan's year boost table
+        (see QueryPlan.year_boost_table). Called through the memoized
+        self._match_masks; the returned arrays are shared between calls
+        and therefore read-only.
+
+        Args:
+            min_year: Year at index 0 of year_weights
+            year_weights: Boost share per year offset from min_year
+            category_filter: Category that counts as a category match
+
+        Returns:
+            Tuple of (year_weight float array, category_matched bool array)
+            over all chunks
+        """
+        if year_weights:
+            table = np.asarray(year_weights, dtype=np.float64)
+            offset = self._years.astype(np.intp) - min_year
+            in_table = (offset >= 0) & (offset < len(table))
+            year_weight = np.where(
+                in_table, table[np.clip(offset, 0, len(table) - 1)], 0.0
+            )
+        else:
+            year_weight = np.zeros(len(self._years), dtype=np.float64)
+
+        category_code = self._category_codes.get(category_filter)
+        if category_code is not None:
+            category_matched = self._categories == category_code
+        else:
+            category_matched = np.zeros(len(self._categories), dtype=bool)
+
+        year_weight.setflags(write=False)
+        category_matched.setflags(write=False)
+        return year_weight, category_matched
+
+    def _temporal_weights(self, idx: np.ndarray, query_time: datetime) -> np.ndarray:
+        """
+        Compute temporal decay weights for chunks by index.
+
+        Paper S2 formula: w_t = exp(-λ · Δt)
+        where Δt is the age in days of the chunk's year (taken as July 1)
+        and λ is the daily decay rate. Weights are floored at 0.01.
+
+        Args:
+            idx: Chunk indices
+            query_time: Query timestamp
+
+        Returns:
+            Temporal weights between 0.01 and 1
+        """
+        if not self.enable_temporal_decay:
+            return np.ones(len(idx), dtype=np.float64)
+
+        doc_ordinals = self._doc_ordinals[idx]
+        delta_days = query_time.toordinal() - doc_ordinals
+
+        # Invalid years and future documents get no decay
+        no_decay = (doc_ordinals < 0) | (delta_days < 0)
+        decay = np.maximum(np.exp(-self.temporal_decay_rate * delta_days), 0.01)
+        return np.where(no_decay, 1.0, decay)
+
+    def _quantize_embeddings(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Store embeddings at the configured precision for cosine scoring.
+
+        Similarity for row i is (codes[i] @ query) * scales[i], so rows
+        are reconstructed as codes * scale:
+
+        - float32: the embeddings themselves (no copy when already
+          float32 and C-contiguous), scales are inverse row norms
+        - float16: normalized rows, halves memory; scales is None
+        - int8: symmetric per-row quantization of normalized rows,
+          quarters memory; scales are per-row step sizes
+
+        Returns:
+            Tuple of (codes, per-row scales)
+        """
+        if self.embedding_dtype not in ("float32", "float16", "int8"):
+            raise ValueError(
+                f"Unknown embedding_dtype: {self.embedding_dtype!r} "
+                f"(expected 'float32', 'float16' or 'int8')"
+            )
+
+        if self.embeddings is None or len(self.embeddings) == 0:
+            return None, None
+
+        if self.embedding_dtype == "float32":
+            codes = np.ascontiguousarray(self.embeddings, dtype=np.float32)
+            norms = np.linalg.norm(codes, axis=1)
+            return codes, (1.0 / (norms + 1e-10)).astype(np.float32)
+
+        # Normalize a single working copy in place
+        normalized = np.array(self.embeddings, dtype=np.float32)
+        normalized /= np.linalg.norm(normalized, axis=1, keepdims=True) + 1e-10
+
+        if self.embedding_dtype == "float16":
+            return normalized.astype(np.float16), None
+
+        scales = np.abs(normalized).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        normalized /= scales[:, None]
+        codes = np.rint(normalized, out=normalized).astype(np.int8)
+        return codes, scales.astype(np.float32)
+
     def _tokenize_with_keyword_preservation(self, text: str) -> List[str]:
         """
         Tokenize text while preserving important keywords.
@@ -195,49 +470,6 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
 
         return enhanced_tokens
 
-    def _compute_temporal_decay(self, chunk: Chunk, query_time: datetime = None) -> float:
-        """
-        Compute temporal decay weight for a chunk.
-
-        Paper S2 formula: w_t = exp(-λ · Δt)
-        where Δt is the time difference in days and λ is the decay rate.
-
-        Args:
-            chunk: Chunk to compute decay for
-            query_time: Query timestamp (defaults to now)
-
-        Returns:
-            Temporal weight between 0 and 1
-        """
-        if not self.enable_temporal_decay:
-            return 1.0
-
-        if query_time is None:
-            query_time = datetime.now()
-
-        # Use chunk's year to compute age
-        # Assume mid-year (July 1) for document timestamp
-        try:
-            doc_time = datetime(chunk.year, 7, 1)
-        except (ValueError, TypeError):
-            # Invalid year, no decay
-            return 1.0
-
-        # Compute time difference in days
-        delta_days = (query_time - doc_time).days
-
-        # For future documents (year > current year), no decay
-        if delta_days < 0:
-            return 1.0
-
-        # Apply exponential decay: w_t = exp(-λ · Δt)
-        # λ = 0.05 means ~50% weight after ~14 days, ~10% after ~46 days
-        # For yearly granularity, adjust λ to be per-year (0.05 * 365 = 18.25)
-        # But we use daily λ as per paper specification
-        decay_weight = math.exp(-self.temporal_decay_rate * delta_days)
-
-        return max(decay_weight, 0.01)  # Floor at 1% to never completely discard
-
     def _compute_trust_score(self, chunk: Chunk) -> float:
         """
         Compute trust score for a chunk.
@@ -326,14 +558,14 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
 
         # Combine scores based on mode
         if self.scoring_mode == "blended":
-            combined = self._combine_scores_blended(
+            fused = self._combine_scores_blended(
                 dense_results, sparse_results, plan.query_type
             )
         else:
-            combined = self._rrf_combine(dense_results, sparse_results)
+            fused = self._rrf_combine(dense_results, sparse_results)
 
         # Apply boosting
-        boosted = self._apply_boosting(combined, plan)
+        boosted = self._apply_boosting(*fused, plan)
 
         # Filter and limit
         candidates = self._filter_and_limit(boosted, plan, top_k)
@@ -347,7 +579,7 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
             candidates=candidates,
             query=query,
             retrieval_strategy=f"hybrid_{self.scoring_mode}",
-            total_candidates_considered=len(combined),
+            total_candidates_considered=len(fused[0]),
             retrieval_time_ms=retrieval_time,
             year_filter=plan.year_filter,
             category_filter=plan.category_filter,
@@ -391,14 +623,14 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
 
         # Combine using blended scoring
         if self.scoring_mode == "blended":
-            combined = self._combine_scores_blended(
+            fused = self._combine_scores_blended(
                 dense_results, sparse_results, plan.query_type
             )
         else:
-            combined = self._rrf_combine(dense_results, sparse_results)
+            fused = self._rrf_combine(dense_results, sparse_results)
 
         # Apply boosting
-        boosted = self._apply_boosting(combined, plan)
+        boosted = self._apply_boosting(*fused, plan)
 
         # Filter and limit
         candidates = self._filter_and_limit(boosted, plan, top_k)
@@ -412,7 +644,7 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
             candidates=candidates,
             query=query,
             retrieval_strategy=f"hybrid_{self.scoring_mode}_prefiltered",
-            total_candidates_considered=len(combined),
+            total_candidates_considered=len(fused[0]),
             retrieval_time_ms=retrieval_time,
             year_filter=plan.year_filter,
             category_filter=plan.category_filter,
@@ -437,22 +669,17 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
 
         query_embedding = self.embedding_engine.encode_query(query)
 
-        # Get embeddings for candidates only
-        candidate_embeddings = self.embeddings[candidate_indices]
+        # Normalize query for cosine similarity
+        query_embedding = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        query_norm = query_embedding / (np.linalg.norm(query_embedding) + 1e-10)
 
-        # Compute similarities
-        if len(query_embedding.shape) == 1:
-            query_embedding = query_embedding.reshape(1, -1)
+        # Gather stored (pre-normalized) rows for candidates only
+        idx = np.asarray(candidate_indices, dtype=np.intp)
+        candidate_codes = np.take(self._dense_codes, idx, axis=0)
 
-        # Normalize for cosine similarity
-        query_norm = query_embedding / (
-            np.linalg.norm(query_embedding, axis=1, keepdims=True) + 1e-10
-        )
-        cand_norms = candidate_embeddings / (
-            np.linalg.norm(candidate_embeddings, axis=1, keepdims=True) + 1e-10
-        )
-
-        similarities = np.dot(cand_norms, query_norm.T).flatten()
+        similarities = candidate_codes.astype(np.float32, copy=False) @ query_norm
+        if self._dense_scales is not None:
+            similarities *= np.take(self._dense_scales, idx)
 
         # Get top-k indices within candidates
         top_k_local = min(k, len(similarities))
@@ -559,112 +786,132 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
         else:
             return self.dense_alpha, self.sparse_beta
 
+    def _gather_candidates(
+        self,
+        dense_results: List[Tuple[int, float, str]],
+        sparse_results: List[Tuple[int, float, str]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Merge dense and sparse hits into parallel per-candidate arrays.
+
+        Candidates keep first-seen order (dense hits, then sparse-only hits).
+        Ranks are 1-based positions in each result list, 0 when absent.
+
+        Returns:
+            Tuple of (indices, dense_scores, sparse_scores, dense_ranks, sparse_ranks)
+        """
+        n_dense, n_sparse = len(dense_results), len(sparse_results)
+        dense_idx = np.fromiter((r[0] for r in dense_results), dtype=np.intp, count=n_dense)
+        sparse_idx = np.fromiter((r[0] for r in sparse_results), dtype=np.intp, count=n_sparse)
+
+        hits = np.concatenate([dense_idx, sparse_idx])
+        _, first_seen = np.unique(hits, return_index=True)
+        indices = hits[np.sort(first_seen)]
+
+        # Position of each hit within indices
+        by_index = np.argsort(indices)
+
+        def positions(idx: np.ndarray) -> np.ndarray:
+            return by_index[np.searchsorted(indices, idx, sorter=by_index)]
+
+        n = len(indices)
+        dense_scores = np.zeros(n, dtype=np.float64)
+        sparse_scores = np.zeros(n, dtype=np.float64)
+        dense_ranks = np.zeros(n, dtype=np.int64)
+        sparse_ranks = np.zeros(n, dtype=np.int64)
+
+        dense_pos = positions(dense_idx)
+        dense_scores[dense_pos] = np.fromiter(
+            (r[1] for r in dense_results), dtype=np.float64, count=n_dense
+        )
+        dense_ranks[dense_pos] = np.arange(1, n_dense + 1)
+
+        sparse_pos = positions(sparse_idx)
+        sparse_scores[sparse_pos] = np.fromiter(
+            (r[1] for r in sparse_results), dtype=np.float64, count=n_sparse
+        )
+        sparse_ranks[sparse_pos] = np.arange(1, n_sparse + 1)
+
+        return indices, dense_scores, sparse_scores, dense_ranks, sparse_ranks
+
     def _combine_scores_blended(
         self,
         dense_results: List[Tuple[int, float, str]],
         sparse_results: List[Tuple[int, float, str]],
         query_type: QueryType,
-    ) -> Dict[int, Dict]:
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Combine dense and sparse scores using weighted blending.
 
         Preserves actual score magnitudes instead of just ranks,
         producing meaningful score differentiation.
+
+        Returns:
+            Tuple of (indices, blended_scores, dense_scores, sparse_scores)
         """
         alpha, beta = self._get_blended_weights(query_type)
-        combined = {}
-
-        # Process dense results
-        for idx, score, _ in dense_results:
-            if idx not in combined:
-                combined[idx] = {
-                    "dense_score": 0.0,
-                    "sparse_score": 0.0,
-                    "dense_rank": 0,
-                    "sparse_rank": 0,
-                }
-            combined[idx]["dense_score"] = score
-
-        # Process sparse results
-        for rank, (idx, score, _) in enumerate(sparse_results, 1):
-            if idx not in combined:
-                combined[idx] = {
-                    "dense_score": 0.0,
-                    "sparse_score": 0.0,
-                    "dense_rank": 0,
-                    "sparse_rank": 0,
-                }
-            combined[idx]["sparse_score"] = score
-            combined[idx]["sparse_rank"] = rank
-
-        # Assign dense ranks for logging
-        dense_sorted = sorted(
-            [(idx, d["dense_score"]) for idx, d in combined.items()],
-            key=lambda x: x[1], reverse=True
-        )
-        for rank, (idx, _) in enumerate(dense_sorted, 1):
-            combined[idx]["dense_rank"] = rank
+        indices, dense, sparse, _, _ = self._gather_candidates(dense_results, sparse_results)
 
-        # Compute blended scores
-        for idx, data in combined.items():
-            blended = alpha * data["dense_score"] + beta * data["sparse_score"]
-            data["blended_score"] = blended
-            # Also store RRF for fallback/comparison
-            data["rrf_score"] = blended  # Use blended as combined_score
+        blended = alpha * dense + beta * sparse
 
         logger.debug(
             f"Blended scoring: alpha={alpha:.2f}, beta={beta:.2f}, "
-            f"query_type={query_type.value}, candidates={len(combined)}"
+            f"query_type={query_type.value}, candidates={len(indices)}"
         )
 
-        return combined
+        return indices, blended, dense, sparse
 
     def _rrf_combine(
         self,
         dense_results: List[Tuple[int, float, str]],
         sparse_results: List[Tuple[int, float, str]],
-    ) -> Dict[int, Dict]:
-        """Legacy RRF combination (preserved for backwards compatibility)."""
-        combined = {}
-
-        for rank, (idx, score, _) in enumerate(dense_results, 1):
-            if idx not in combined:
-                combined[idx] = {
-                    "dense_score": 0.0,
-                    "sparse_score": 0.0,
-                    "dense_rank": 0,
-                    "sparse_rank": 0,
-                }
-            combined[idx]["dense_score"] = score
-            combined[idx]["dense_rank"] = rank
-
-        for rank, (idx, score, _) in enumerate(sparse_results, 1):
-            if idx not in combined:
-                combined[idx] = {
-                    "dense_score": 0.0,
-                    "sparse_score": 0.0,
-                    "dense_rank": 0,
-                    "sparse_rank": 0,
-                }
-            combined[idx]["sparse_score"] = score
-            combined[idx]["sparse_rank"] = rank
-
-        for idx, data in combined.items():
-            rrf_score = 0.0
-            if data["dense_rank"] > 0:
-                rrf_score += self.dense_weight / (self.rrf_k + data["dense_rank"])
-            if data["sparse_rank"] > 0:
-                rrf_score += self.sparse_weight / (self.rrf_k + data["sparse_rank"])
-            data["rrf_score"] = rrf_score
-            data["blended_score"] = rrf_score
-
-        return combined
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Legacy RRF combination (preserved for backwards compatibility).
+
+        Returns:
+            Tuple of (indices, rrf_scores, dense_scores, sparse_scores)
+        """
+        indices, dense, sparse, dense_ranks, sparse_ranks = self._gather_candidates(
+            dense_results, sparse_results
+        )
+
+        rrf = (
+            np.where(dense_ranks > 0, self.dense_weight / (self.rrf_k + dense_ranks), 0.0) +
+            np.where(sparse_ranks > 0, self.sparse_weight / (self.rrf_k + sparse_ranks), 0.0)
+        )
+
+        return indices, rrf, dense, sparse
+
+    @staticmethod
+    def _combined_to_arrays(
+        combined: Dict[int, Dict],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Unpack a legacy {idx: {"rrf_score", "dense_score", "sparse_score"}} dict.
+
+        Returns:
+            Tuple of (indices, scores, dense_scores, sparse_scores)
+        """
+        n = len(combined)
+        rows = list(combined.values())
+        indices = np.fromiter(combined, dtype=np.intp, count=n)
+        scores = np.fromiter(
+            (d.get("blended_score", d.get("rrf_score", 0.0)) for d in rows),
+            dtype=np.float64, count=n,
+        )
+        dense = np.fromiter((d["dense_score"] for d in rows), dtype=np.float64, count=n)
+        sparse = np.fromiter((d["sparse_score"] for d in rows), dtype=np.float64, count=n)
+        return indices, scores, dense, sparse
 
     def _apply_boosting(
         self,
-        combined: Dict[int, Dict],
+        cand_idx: np.ndarray,
+        scores: np.ndarray,
+        dense: np.ndarray,
+        sparse: np.ndarray,
         plan: QueryPlan,
-    ) -> List[ScoredChunk]:
+    ) -> BoostedResults:
         """
         Apply year, category boosting, temporal decay, and trust scoring.
 
@@ -681,131 +928,197 @@ class HybridRRFStrategy(BaseRetrievalStrategy):
           final = rrf + year_boost + category_boost
 
         Safety: Only boost if dense_score >= semantic_threshold.
+
+        Args:
+            cand_idx: Candidate chunk indices
+            scores: Fused (blended or RRF) score per candidate
+            dense: Dense similarity per candidate
+            sparse: BM25 score per candidate
+            plan: Query plan with filters
         """
-        scored_chunks = []
-        query_time = datetime.now()
+        results = self._boost_candidates(cand_idx, scores, dense, sparse, plan)
+        results = results.take(np.argsort(-results.final_scores, kind="stable"))
+
+        # Log score distribution for debugging
+        if len(results):
+            scores = results.final_scores[:10]
+            trust_filtered = (
+                int((results.trust_scores < self.trust_threshold).sum())
+                if self.enable_trust_filtering else 0
+            )
+            logger.debug(
+                f"Top-10 score distribution: "
+                f"max={scores[0]:.4f}, min={scores[-1]:.4f}, "
+                f"range={scores[0] - scores[-1]:.4f}, "
+                f"trust_filtered={trust_filtered}"
+            )
 
-        # Determine valid years for boosting
-        valid_years = set()
-        if plan.year_filter is not None:
-            valid_years.add(plan.year_filter)
-        if plan.filters.year_range is not None:
-            start_year, end_year = plan.filters.year_range
-            valid_years.update(range(start_year, end_year + 1))
+        return results
 
-        filtered_by_trust = 0
+    def _apply_boosting_from_dict(
+        self,
+        combined: Dict[int, Dict],
+        plan: QueryPlan,
+    ) -> BoostedResults:
+        """_apply_boosting for the legacy {idx: score-dict} candidate format."""
+        return self._apply_boosting(*self._combined_to_arrays(combined), plan)
 
-        for idx, data in combined.items():
-            chunk = self.get_chunk_by_index(idx)
-            if not chunk:
-                continue
+    def apply_boosting_indexed(
+        self,
+        combined: Dict[int, Dict],
+        plan: QueryPlan,
+    ) -> Dict[str, ScoredChunk]:
+        """
+        Boost candidates and index the results by chunk_id.
 
-            dense_score = data["dense_score"]
-            blended_score = data.get("blended_score", data.get("rrf_score", 0.0))
+        Same scores as _apply_boosting; the dict preserves final-score order.
+        When several chunks share a chunk_id, the best-scored one is kept.
 
-            # Compute temporal decay weight (paper S2)
-            temporal_weight = self._compute_temporal_decay(chunk, query_time)
+        Args:
+            combined: Candidate scores keyed by chunk index
+            plan: Query plan with filters
 
-            # Compute trust score (paper S3, S7)
-            trust_score = self._compute_trust_score(chunk)
+        Returns:
+            Mapping of chunk_id to ScoredChunk, best first
+        """
+        result: Dict[str, ScoredChunk] = {}
+        for sc in self._apply_boosting_from_dict(combined, plan):
+            result.setdefault(sc.chunk_id, sc)
+        return result
 
-            # Apply trust filtering (paper: threshold 0.7)
-            if self.enable_trust_filtering and trust_score < self.trust_threshold:
-                # Don't completely discard, but heavily penalize low-trust chunks
-                # This allows them to appear if no better options exist
-                trust_penalty = 0.5  # Reduce score by 50% for low-trust
-                filtered_by_trust += 1
-            else:
-                trust_penalty = 1.0
+    def top_k(
+        self,
+        combined: Dict[int, Dict],
+        plan: QueryPlan,
+        k: int,
+    ) -> List[ScoredChunk]:
+        """
+        Boost candidates and return only the k best, best first.
 
-            # Determine matches
-            year_matched = bool(valid_years) and chunk.year in valid_years
-            category_matched = (
-                plan.category_filter is not None
-                and chunk.category == plan.category_filter
-            )
+        Finds the k-th best score with np.partition in O(n) and sorts just
+        the candidates that make the cut, rather than sorting every
+        candidate as _apply_boosting does. Ties at the k-th score go to the
+        earliest candidates, matching the stable full sort.
+
+        Args:
+            combined: Candidate scores keyed by chunk index
+            plan: Query plan with filters
+            k: Number of results
+
+        Returns:
+            Up to k ScoredChunks sorted by final_score descending
+        """
+        results = self._boost_candidates(*self._combined_to_arrays(combined), plan)
+        final = results.final_scores
 
-            # Only apply boost if semantic relevance above threshold
-            meets_threshold = dense_score >= self.semantic_threshold
-
-            if meets_threshold and self.scoring_mode == "blended":
-                # Multiplicative boosting: preserves semantic ordering
-                year_mult = (1.0 + self.year_boost) if year_matched else 1.0
-                cat_mult = (1.0 + self.category_boost) if category_matched else 1.0
-
-                # Apply temporal decay and trust
-                # Paper formula: S = α * S_sim + β * w_t + γ * T
-                # Simplified: final = blended * year_mult * cat_mult * temporal * trust_penalty
-                final_score = (
-                    blended_score *
-                    year_mult *
-                    cat_mult *
-                    temporal_weight *
-                    trust_penalty
-                )
-                applied_year_boost = self.year_boost if year_matched else 0.0
-                applied_category_boost = self.category_boost if category_matched else 0.0
-            elif meets_threshold:
-                # Additive boosting (legacy RRF mode) with temporal decay
-                applied_year_boost = self.year_boost if year_matched else 0.0
-                applied_category_boost = self.category_boost if category_matched else 0.0
-                final_score = (
-                    (blended_score + applied_year_boost + applied_category_boost) *
-                    temporal_weight *
-                    trust_penalty
-                )
+        if k <= 0:
+            return []
+        if k >= len(results):
+            positions = np.argsort(-final, kind="stable")
+        else:
+            neg = -final
+            kth = np.partition(neg, k - 1)[k - 1]
+            if np.isnan(kth):
+                positions = np.argsort(neg, kind="stable")[:k]
             else:
-                # Below threshold: no boost, but still apply temporal decay
-                final_score = blended_score * temporal_weight * trust_penalty
-                applied_year_boost = 0.0
-                applied_category_boost = 0.0
-
-            scored_chunk = ScoredChunk(
-                chunk=chunk,
-                vector_score=dense_score,
-                bm25_score=data["sparse_score"],
-                combined_score=data.get("rrf_score", blended_score),
-                blended_score=blended_score,
-                final_score=final_score,
-                year_boost=applied_year_boost,
-                category_boost=applied_category_boost,
-                year_matched=year_matched,
-                category_matched=category_matched,
-                temporal_weight=temporal_weight,
-                trust_score=trust_score,
-            )
-            scored_chunks.append(scored_chunk)
+                # Everything strictly better than the k-th score, then the
+                # earliest candidates tied with it
+                above = np.flatnonzero(neg < kth)
+                tied = np.flatnonzero(neg == kth)[:k - len(above)]
+                positions = np.concatenate((above, tied))
+                positions = positions[np.lexsort((positions, neg[positions]))]
 
-        scored_chunks.sort(key=lambda x: x.final_score, reverse=True)
+        return list(results.take(positions))
 
-        # Log score distribution for debugging
-        if scored_chunks:
-            scores = [sc.final_score for sc in scored_chunks[:10]]
-            logger.debug(
-                f"Top-10 score distribution: "
-                f"max={scores[0]:.4f}, min={scores[-1]:.4f}, "
-                f"range={scores[0] - scores[-1]:.4f}, "
-                f"trust_filtered={filtered_by_trust}"
+    def _boost_candidates(
+        self,
+        cand_idx: np.ndarray,
+        scores: np.ndarray,
+        dense: np.ndarray,
+        sparse: np.ndarray,
+        plan: QueryPlan,
+    ) -> BoostedResults:
+        """Score candidates as described in _apply_boosting, in candidate order."""
+        query_time = datetime.now()
+
+        # Drop indices that don't refer to a chunk
+        valid = (cand_idx >= 0) & (cand_idx < len(self.chunks))
+        if not valid.all():
+            cand_idx, scores, dense, sparse = (
+                cand_idx[valid], scores[valid], dense[valid], sparse[valid]
             )
+        if len(cand_idx) == 0:
+            return BoostedResults.empty(self.chunks)
+
+        idx = np.asarray(cand_idx, dtype=np.intp)
+        blended = np.asarray(scores, dtype=np.float64)
+        dense = np.asarray(dense, dtype=np.float64)
+        sparse = np.asarray(sparse, dtype=np.float64)
+        n = len(idx)
+
+        # Temporal decay (paper S2) and trust score (paper S3, S7)
+        temporal = self._temporal_weights(idx, query_time)
+        trust = self._trust_scores[idx]
+
+        # Low-trust chunks are penalized by 50% rather than discarded,
+        # so they can still appear if no better options exist
+        if self.enable_trust_filtering:
+            low_trust = trust < self.trust_threshold
+        else:
+            low_trust = np.zeros(n, dtype=bool)
+        trust_penalty = np.where(low_trust, 0.5, 1.0)
 
-        return scored_chunks
+        # Determine matches
+        min_year, year_weights = plan.year_boost_table
+        year_weight_all, category_mask = self._match_masks(
+            min_year, year_weights, plan.category_filter
+        )
+        year_weight = year_weight_all[idx]
+        year_matched = year_weight > 0
+        category_matched = category_mask[idx]
+
+        # Only apply boost if semantic relevance above threshold.
+        # Blended mode boosts multiplicatively, rrf mode additively.
+        final, applied_year_boost, applied_category_boost = boost_scores(
+            blended, dense, temporal, trust_penalty,
+            year_weight, category_matched,
+            self.year_boost, self.category_boost, self.semantic_threshold,
+            multiplicative=self.scoring_mode == "blended",
+        )
+
+        return BoostedResults(
+            chunks=self.chunks,
+            chunk_indices=idx,
+            vector_scores=dense,
+            bm25_scores=sparse,
+            combined_scores=blended,
+            blended_scores=blended,
+            final_scores=final,
+            year_boosts=applied_year_boost,
+            category_boosts=applied_category_boost,
+            temporal_weights=temporal,
+            trust_scores=trust,
+            year_matched=year_matched,
+            category_matched=category_matched,
+        )
 
     def _filter_and_limit(
         self,
-        candidates: List[ScoredChunk],
+        candidates: BoostedResults,
         plan: QueryPlan,
         top_k: int,
     ) -> List[ScoredChunk]:
         """Filter candidates and limit to top_k."""
         if plan.year_filter:
-            year_matched = [c for c in candidates if c.year_matched]
-            other = [c for c in candidates if not c.year_matched]
-            result = year_matched[:top_k]
-            remaining = top_k - len(result)
-            if remaining > 0:
-                result.extend(other[:remaining])
+            # Year-matched first, then fill with the best of the rest
+            year_matched = np.flatnonzero(candidates.year_matched)[:top_k]
+            remaining = top_k - len(year_matched)
+            other = np.flatnonzero(~candidates.year_matched)[:max(remaining, 0)]
+            positions = np.concatenate([year_matched, other])
         else:
-            result = candidates[:top_k]
+            positions = np.arange(min(top_k, len(candidates)))
+
+        result = [candidates[i] for i in positions.tolist()]
 
         for i, chunk in enumerate(result):
             chunk.rank = i + 1
@@ -6,7 +6,7 @@ Models for query analysis, classification, and planning.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 
 class QueryType(str, Enum):
@@ -153,6 +153,33 @@ class QueryPlan:
         """Check if query has category focus."""
         return self.filters.has_category_constraint()
 
+    @property
+    def year_boost_table(self) -> Tuple[Optional[int], Tuple[float, ...]]:
+        """
+        Year boost weights for retrieval as (min_year, weights).
+
+        weights[year - min_year] is the share of the year boost a chunk from
+        that year receives (0.0 = no boost, 1.0 = full boost). The year filter
+        and every year in year_range get full weight.
+        Returns (None, ()) when the plan has no year constraint.
+        """
+        years = set()
+        if self.filters.year_filter is not None:
+            years.add(self.filters.year_filter)
+        if self.filters.year_range is not None:
+            start_year, end_year = self.filters.year_range
+            years.update(range(start_year, end_year + 1))
+
+        if not years:
+            return None, ()
+
+        min_year = min(years)
+        weights = tuple(
+            1.0 if year in years else 0.0
+            for year in range(min_year, max(years) + 1)
+        )
+        return min_year, weights
+
     def get_search_terms(self) -> List[str]:
         """Get all search terms for retrieval."""
         return self.expansion.get_all_terms()
@@ -5,7 +5,8 @@ Provides common fixtures for unit and integration tests.
 """
 
 import pytest
-from typing import List
+import numpy as np
+from typing import List, Tuple
 from dataclasses import replace
 
 from src.models.chunk import Chunk
@@ -24,6 +25,14 @@ from src.models.retrieval import (
 from src.config import MNEMEConfig
 
 
+def pytest_configure(config):
+    """Register markers so runs without pytest-xdist don't warn on them."""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keep a test class on one xdist worker (--dist=loadgroup)",
+    )
+
+
 # =============================================================================
 # Configuration Fixtures
 # =============================================================================
@@ -42,12 +51,23 @@ def small_context_config() -> MNEMEConfig:
     return config
 
 
+# =============================================================================
+# Random Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def rng() -> np.random.Generator:
+    """Seeded random generator shared across the test session."""
+    return np.random.default_rng(42)
+
+
 # =============================================================================
 # Chunk Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_chunk():
     """Factory fixture for creating Chunk instances."""
     def _make_chunk(
@@ -105,10 +125,11 @@ def chunk_2022(make_chunk) -> Chunk:
     )
 
 
-@pytest.fixture
-def multi_year_chunks(make_chunk) -> List[Chunk]:
+@pytest.fixture(scope="module")
+def multi_year_chunks(make_chunk) -> Tuple[Chunk, ...]:
     """Collection of chunks from multiple years."""
-    return [
+    # Tuple, since the module shares one collection
+    return (
         make_chunk(chunk_id="c1", year=2020, text="Content from 2020"),
         make_chunk(chunk_id="c2", year=2020, text="More content from 2020"),
         make_chunk(chunk_id="c3", year=2021, text="Content from 2021"),
@@ -117,7 +138,7 @@ def multi_year_chunks(make_chunk) -> List[Chunk]:
         make_chunk(chunk_id="c6", year=2022, text="Content from 2022"),
         make_chunk(chunk_id="c7", year=2022, text="More content from 2022"),
         make_chunk(chunk_id="c8", year=2023, text="Content from 2023"),
-    ]
+    )
 
 
 # =============================================================================
@@ -125,7 +146,7 @@ def multi_year_chunks(make_chunk) -> List[Chunk]:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_scored_chunk(make_chunk):
     """Factory fixture for creating ScoredChunk instances."""
     def _make_scored_chunk(
@@ -157,8 +178,8 @@ def make_scored_chunk(make_chunk):
     return _make_scored_chunk
 
 
-@pytest.fixture
-def year_matched_scored_chunks(make_chunk, make_scored_chunk) -> List[ScoredChunk]:
+@pytest.fixture(scope="module")
+def year_matched_scored_chunks(make_chunk, make_scored_chunk) -> Tuple[ScoredChunk, ...]:
     """Scored chunks with some matching year 2021."""
     chunks = [
         make_chunk(chunk_id="c1", year=2021, text="First 2021 content"),
@@ -168,13 +189,14 @@ def year_matched_scored_chunks(make_chunk, make_scored_chunk) -> List[ScoredChun
         make_chunk(chunk_id="c5", year=2022, text="Content from 2022"),
     ]
 
-    return [
+    # Tuple, since the module (and retrieval_result_with_year_match) shares it
+    return (
         make_scored_chunk(chunk=chunks[0], year_matched=True, final_score=0.9),
         make_scored_chunk(chunk=chunks[1], year_matched=True, final_score=0.85),
         make_scored_chunk(chunk=chunks[2], year_matched=True, final_score=0.8),
         make_scored_chunk(chunk=chunks[3], year_matched=False, final_score=0.7),
         make_scored_chunk(chunk=chunks[4], year_matched=False, final_score=0.65),
-    ]
+    )
 
 
 # =============================================================================
@@ -182,7 +204,7 @@ def year_matched_scored_chunks(make_chunk, make_scored_chunk) -> List[ScoredChun
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_query_plan():
     """Factory fixture for creating QueryPlan instances."""
     def _make_query_plan(
@@ -226,7 +248,7 @@ def simple_query_plan(make_query_plan) -> QueryPlan:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temporal_query_plan_2021(make_query_plan) -> QueryPlan:
     """A temporal query plan for 2021."""
     return make_query_plan(
@@ -252,7 +274,7 @@ def synthesis_query_plan(make_query_plan) -> QueryPlan:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_retrieval_result(make_scored_chunk):
     """Factory fixture for creating RetrievalResult instances."""
     def _make_retrieval_result(
@@ -273,7 +295,7 @@ def make_retrieval_result(make_scored_chunk):
     return _make_retrieval_result
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def retrieval_result_with_year_match(
     year_matched_scored_chunks,
     make_retrieval_result,
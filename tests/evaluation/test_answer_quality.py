@@ -10,8 +10,12 @@ MNEME Answer Quality Evaluation Test Suite
 Run with: python -m pytest tests/evaluation/test_answer_quality.py -v
 """
 
+import operator
+import sys
+
+import numpy as np
 import pytest
-from typing import Optional, List, Tuple
+from typing import NamedTuple, Optional, List, Tuple
 from dataclasses import dataclass
 
 from src.layer4_query.filters import FilterExtractor
@@ -33,6 +37,28 @@ class EvaluationCase:
     description: str
     is_comparison_query: bool = False
 
+    def __post_init__(self):
+        # Descriptions double as parametrize ids; intern them once
+        self.description = sys.intern(self.description)
+
+
+class EvalCorpus(NamedTuple):
+    """Columnar view of the evaluation cases (-1 marks a missing year)."""
+    queries: Tuple[str, ...]
+    expected_year_filter: np.ndarray
+
+    @classmethod
+    def from_cases(cls, cases: List[EvaluationCase]) -> "EvalCorpus":
+        """Build the columnar corpus from a list of cases."""
+        return cls(
+            queries=tuple(c.query for c in cases),
+            expected_year_filter=np.fromiter(
+                (-1 if c.expected_year_filter is None else c.expected_year_filter for c in cases),
+                dtype=np.int32,
+                count=len(cases),
+            ),
+        )
+
 
 # =============================================================================
 # 10-Question Evaluation Suite
@@ -112,6 +138,9 @@ EVALUATION_CASES = [
     ),
 ]
 
+# Columnar copy of EVALUATION_CASES for the aggregate metrics test
+_CORPUS = EvalCorpus.from_cases(EVALUATION_CASES)
+
 
 # =============================================================================
 # Year Extraction Tests
@@ -125,7 +154,7 @@ class TestYearExtraction:
         """Create a FilterExtractor instance."""
         return FilterExtractor()
 
-    @pytest.mark.parametrize("case", EVALUATION_CASES, ids=[c.description for c in EVALUATION_CASES])
+    @pytest.mark.parametrize("case", EVALUATION_CASES, ids=operator.attrgetter("description"))
     def test_year_extraction(self, filter_extractor, case: EvaluationCase):
         """Test that years are correctly extracted from queries."""
         filters = filter_extractor.extract(case.query)
@@ -137,7 +166,7 @@ class TestYearExtraction:
         )
 
     @pytest.mark.parametrize("case", [c for c in EVALUATION_CASES if c.is_comparison_query],
-                             ids=[c.description for c in EVALUATION_CASES if c.is_comparison_query])
+                             ids=operator.attrgetter("description"))
     def test_year_range_extraction(self, filter_extractor, case: EvaluationCase):
         """Test that year ranges are correctly extracted for comparison queries."""
         filters = filter_extractor.extract(case.query)
@@ -224,6 +253,41 @@ class TestYearExtractionEdgeCases:
 # Confidence Scoring Tests
 # =============================================================================
 
+# Shared read-only candidates for ConfidenceAssessor tests
+_BASE_CHUNK = Chunk(
+    chunk_id="test_chunk",
+    doc_id="test_doc",
+    text="Test content",
+    year=2021,
+    category="test",
+    chunk_index=0,
+)
+
+_SCORED_YM = ScoredChunk(
+    chunk=_BASE_CHUNK,
+    vector_score=0.5,
+    bm25_score=1.0,
+    combined_score=0.6,
+    final_score=0.6,
+    year_boost=0.5,
+    category_boost=0.0,
+    year_matched=True,
+    category_matched=False,
+)
+
+_SCORED_NO = ScoredChunk(
+    chunk=_BASE_CHUNK,
+    vector_score=0.5,
+    bm25_score=1.0,
+    combined_score=0.6,
+    final_score=0.6,
+    year_boost=0.0,
+    category_boost=0.0,
+    year_matched=False,
+    category_matched=False,
+)
+
+
 class TestConfidenceScoring:
     """Tests for confidence scoring accuracy."""
 
@@ -282,59 +346,19 @@ class TestConfidenceAssessor:
     def assessor(self):
         return ConfidenceAssessor()
 
-    @pytest.fixture
-    def mock_chunk(self):
-        """Create a mock chunk."""
-        return Chunk(
-            chunk_id="test_chunk",
-            doc_id="test_doc",
-            text="Test content",
-            year=2021,
-            category="test",
-            chunk_index=0,
-        )
-
-    def _create_scored_chunk(self, chunk: Chunk, year_matched: bool) -> ScoredChunk:
-        """Helper to create a ScoredChunk."""
-        return ScoredChunk(
-            chunk=chunk,
-            vector_score=0.5,
-            bm25_score=1.0,
-            combined_score=0.6,
-            final_score=0.6,
-            year_boost=0.5 if year_matched else 0.0,
-            category_boost=0.0,
-            year_matched=year_matched,
-            category_matched=False,
-        )
-
-    def test_assess_year_matched(self, assessor, mock_chunk):
+    def test_assess_year_matched(self, assessor):
         """Test assess returns YEAR_MATCHED when year-matched docs exist."""
-        candidates = [
-            self._create_scored_chunk(mock_chunk, year_matched=True),
-            self._create_scored_chunk(mock_chunk, year_matched=True),
-        ]
-        confidence = assessor.assess(candidates, year_filter=2021)
+        confidence = assessor.assess([_SCORED_YM, _SCORED_YM], year_filter=2021)
         assert confidence == RetrievalConfidence.YEAR_MATCHED
 
-    def test_assess_partial_match(self, assessor, mock_chunk):
+    def test_assess_partial_match(self, assessor):
         """Test assess returns PARTIAL_MATCH when year filter set but no match."""
-        candidates = [
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-        ]
-        confidence = assessor.assess(candidates, year_filter=2021)
+        confidence = assessor.assess([_SCORED_NO, _SCORED_NO, _SCORED_NO], year_filter=2021)
         assert confidence == RetrievalConfidence.PARTIAL_MATCH
 
-    def test_assess_good_match_no_filter(self, assessor, mock_chunk):
+    def test_assess_good_match_no_filter(self, assessor):
         """Test assess returns GOOD_MATCH when no year filter and enough results."""
-        candidates = [
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-            self._create_scored_chunk(mock_chunk, year_matched=False),
-        ]
-        confidence = assessor.assess(candidates, year_filter=None)
+        confidence = assessor.assess([_SCORED_NO, _SCORED_NO, _SCORED_NO], year_filter=None)
         assert confidence == RetrievalConfidence.GOOD_MATCH
 
     def test_assess_no_results(self, assessor):
@@ -437,15 +461,21 @@ class TestMetrics:
 
     def test_year_extraction_accuracy(self, filter_extractor):
         """Calculate year extraction accuracy across all test cases."""
-        correct = 0
-        total = len(EVALUATION_CASES)
+        total = len(_CORPUS.queries)
+        results = filter_extractor.extract_batch(_CORPUS.queries)
+        extracted = np.fromiter(
+            (-1 if r.year_filter is None else r.year_filter for r in results),
+            dtype=np.int32,
+            count=total,
+        )
+        matches = extracted == _CORPUS.expected_year_filter
+        correct = int(matches.sum())
 
-        for case in EVALUATION_CASES:
-            filters = filter_extractor.extract(case.query)
-            if filters.year_filter == case.expected_year_filter:
-                correct += 1
-            else:
-                print(f"FAIL: '{case.query}' - expected {case.expected_year_filter}, got {filters.year_filter}")
+        for i in np.flatnonzero(~matches):
+            print(
+                f"FAIL: '{_CORPUS.queries[i]}' - expected "
+                f"{EVALUATION_CASES[i].expected_year_filter}, got {results[i].year_filter}"
+            )
 
         accuracy = correct / total * 100
         print(f"\nYear Extraction Accuracy: {accuracy:.1f}% ({correct}/{total})")
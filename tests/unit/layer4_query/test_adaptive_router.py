@@ -8,6 +8,8 @@ Tests routing decisions based on query type and difficulty.
 import pytest
 
 from src.models.query import QueryPlan, QueryType, QueryFilters, QueryExpansion
+from src.layer4_query.difficulty import QueryDifficulty
+from src.layer4_query.routing import AdaptiveRouter, RoutingDecision
 
 
 class TestAdaptiveRouter:
@@ -16,7 +18,6 @@ class TestAdaptiveRouter:
     @pytest.fixture
     def router(self):
         """Create an AdaptiveRouter instance."""
-        from src.layer4_query.routing import AdaptiveRouter
         return AdaptiveRouter()
 
     @pytest.fixture
@@ -41,8 +42,6 @@ class TestAdaptiveRouter:
 
     def test_route_specific_easy_returns_3_5_docs(self, router, make_plan_for_routing):
         """SPECIFIC + EASY → 3-5 docs."""
-        from src.layer4_query.routing import RoutingDecision
-
         plan = make_plan_for_routing(QueryType.SPECIFIC, 0.2)  # EASY
         decision = router.route(plan)
 
@@ -146,9 +145,6 @@ class TestAdaptiveRouter:
 
     def test_routing_decision_has_difficulty(self, router, make_plan_for_routing):
         """RoutingDecision should include the classified difficulty."""
-        from src.layer4_query.difficulty import QueryDifficulty
-        from src.layer4_query.routing import RoutingDecision
-
         plan = make_plan_for_routing(QueryType.SPECIFIC, 0.2)
         decision = router.route(plan)
 
@@ -165,6 +161,14 @@ class TestAdaptiveRouter:
         assert hasattr(decision, "max_docs")
         assert hasattr(decision, "year_prefilter_range")
 
+    def test_repeat_route_returns_cached_decision(self, router, make_plan_for_routing):
+        """Routing the same state twice should reuse the precomputed decision."""
+        first = router.route(make_plan_for_routing(QueryType.TEMPORAL, 0.5, year_filter=2021))
+        second = router.route(make_plan_for_routing(QueryType.TEMPORAL, 0.5, year_filter=2019))
+
+        assert second is first
+        assert router.route(make_plan_for_routing(QueryType.TEMPORAL, 0.5)) is not first
+
     # =========================================================================
     # Edge Cases
     # =========================================================================
@@ -194,7 +198,6 @@ class TestRoutingTableCoverage:
     @pytest.fixture
     def router(self):
         """Create an AdaptiveRouter instance."""
-        from src.layer4_query.routing import AdaptiveRouter
         return AdaptiveRouter()
 
     def test_routing_table_exists(self, router):
@@ -7,6 +7,8 @@ CRITICAL FIX: These tests verify that:
 3. Year-specific queries get proper temporal classification
 """
 
+import functools
+
 import pytest
 from src.models.query import QueryType, QueryIntent
 from src.layer4_query.classification import QueryClassifier, classify_query
@@ -17,10 +19,40 @@ from src.layer4_query.classification import QueryClassifier, classify_query
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def classifier():
-    """Create a QueryClassifier instance."""
-    return QueryClassifier()
+    """Create a QueryClassifier instance with per-query memoization."""
+    c = QueryClassifier()
+    # classify_type/is_year_specific are pure, so repeat queries hit the cache
+    c.classify_type = functools.lru_cache(maxsize=256)(c.classify_type)
+    c.is_year_specific = functools.lru_cache(maxsize=256)(c.is_year_specific)
+    return c
+
+
+# =============================================================================
+# Shared Query Tables
+# =============================================================================
+
+WHAT_HAPPENED_TOPIC_QUERIES = [
+    "What happened with machine learning in 2020?",
+    "What happened to the economy in 2019?",
+    "What happened regarding climate change in 2022?",
+]
+
+TOPIC_IN_YEAR_QUERIES = [
+    "AI developments in 2021",
+    "Machine learning in 2020",
+    "Technology trends in 2022",
+    "Research progress in 2019",
+]
+
+EVENTS_IN_YEAR_QUERIES = [
+    "Major events in 2021",
+    "Key discoveries in 2020",
+    "Important breakthroughs in 2022",
+]
+
+YEAR_QUERIES = [(y, f"What happened in {y}?") for y in ("1999", "2000", "2021", "2025")]
 
 
 # =============================================================================
@@ -45,18 +77,13 @@ class TestWhatHappenedInYearPattern:
             f"'What happened in AI in 2021?' should be TEMPORAL, got {query_type}"
         )
 
-    def test_what_happened_with_topic_and_year(self, classifier):
+    @pytest.mark.parametrize("query", WHAT_HAPPENED_TOPIC_QUERIES)
+    def test_what_happened_with_topic_and_year(self, classifier, query):
         """Query with topic + year should be TEMPORAL."""
-        queries = [
-            "What happened with machine learning in 2020?",
-            "What happened to the economy in 2019?",
-            "What happened regarding climate change in 2022?",
-        ]
-        for query in queries:
-            query_type, _ = classifier.classify_type(query)
-            assert query_type == QueryType.TEMPORAL, (
-                f"'{query}' should be TEMPORAL, got {query_type}"
-            )
+        query_type, _ = classifier.classify_type(query)
+        assert query_type == QueryType.TEMPORAL, (
+            f"'{query}' should be TEMPORAL, got {query_type}"
+        )
 
 
 # =============================================================================
@@ -67,32 +94,21 @@ class TestWhatHappenedInYearPattern:
 class TestInYearPattern:
     """Tests for 'in [year]' queries."""
 
-    def test_topic_in_year_is_temporal(self, classifier):
+    @pytest.mark.parametrize("query", TOPIC_IN_YEAR_QUERIES)
+    def test_topic_in_year_is_temporal(self, classifier, query):
         """'[topic] in [year]' queries should be classified as TEMPORAL."""
-        queries = [
-            "AI developments in 2021",
-            "Machine learning in 2020",
-            "Technology trends in 2022",
-            "Research progress in 2019",
-        ]
-        for query in queries:
-            query_type, _ = classifier.classify_type(query)
-            assert query_type == QueryType.TEMPORAL, (
-                f"'{query}' should be TEMPORAL, got {query_type}"
-            )
+        query_type, _ = classifier.classify_type(query)
+        assert query_type == QueryType.TEMPORAL, (
+            f"'{query}' should be TEMPORAL, got {query_type}"
+        )
 
-    def test_events_in_year_is_temporal(self, classifier):
+    @pytest.mark.parametrize("query", EVENTS_IN_YEAR_QUERIES)
+    def test_events_in_year_is_temporal(self, classifier, query):
         """Event-focused queries with year should be TEMPORAL."""
-        queries = [
-            "Major events in 2021",
-            "Key discoveries in 2020",
-            "Important breakthroughs in 2022",
-        ]
-        for query in queries:
-            query_type, _ = classifier.classify_type(query)
-            assert query_type == QueryType.TEMPORAL, (
-                f"'{query}' should be TEMPORAL, got {query_type}"
-            )
+        query_type, _ = classifier.classify_type(query)
+        assert query_type == QueryType.TEMPORAL, (
+            f"'{query}' should be TEMPORAL, got {query_type}"
+        )
 
 
 # =============================================================================
@@ -132,15 +148,13 @@ class TestTemporalPhrasePatterns:
 class TestYearBoundaries:
     """Tests for various year formats."""
 
-    def test_four_digit_years_are_detected(self, classifier):
+    @pytest.mark.parametrize("year,query", YEAR_QUERIES)
+    def test_four_digit_years_are_detected(self, classifier, year, query):
         """Four-digit years from 1900s and 2000s should trigger TEMPORAL."""
-        years = ["1999", "2000", "2021", "2025"]
-        for year in years:
-            query = f"What happened in {year}?"
-            query_type, _ = classifier.classify_type(query)
-            assert query_type == QueryType.TEMPORAL, (
-                f"Query with year {year} should be TEMPORAL"
-            )
+        query_type, _ = classifier.classify_type(query)
+        assert query_type == QueryType.TEMPORAL, (
+            f"Query with year {year} should be TEMPORAL"
+        )
 
     def test_multiple_years_is_temporal(self, classifier):
         """Queries mentioning multiple years should be TEMPORAL."""
@@ -188,6 +202,30 @@ class TestClassifyQueryFunction:
         assert query_type == QueryType.TEMPORAL
 
 
+# =============================================================================
+# Batch Classification Tests
+# =============================================================================
+
+
+class TestBatchClassification:
+    """Tests for the classify_types_batch method."""
+
+    def test_batch_matches_single_classification(self):
+        """Batch results should match per-query classify_type results."""
+        classifier = QueryClassifier()
+        queries = ["What happened in 2021?", "Compare GPT-3 vs GPT-4", "How does GPT work?"]
+        assert classifier.classify_types_batch(queries) == [
+            classifier.classify_type(q) for q in queries
+        ]
+
+    def test_batch_detects_four_digit_years(self, classifier):
+        """A single batch call should classify every year query as TEMPORAL."""
+        results = classifier.classify_types_batch([q for _, q in YEAR_QUERIES])
+        assert all(t == QueryType.TEMPORAL for t, _ in results), (
+            f"Queries with four-digit years should be TEMPORAL, got {results}"
+        )
+
+
 # =============================================================================
 # Year Detection Method Tests
 # =============================================================================
@@ -232,12 +270,10 @@ class TestClassificationConfidence:
         query1 = "What happened in 2021?"  # One pattern
         query2 = "How has AI changed over time since 2020?"  # Multiple patterns
 
-        _, conf1 = classifier.classify_type(query1)
-        _, conf2 = classifier.classify_type(query2)
+        type1, conf1 = classifier.classify_type(query1)
+        type2, conf2 = classifier.classify_type(query2)
 
         # Query with more patterns should have higher or equal confidence
         # (At minimum, both should be classified as TEMPORAL)
-        type1, _ = classifier.classify_type(query1)
-        type2, _ = classifier.classify_type(query2)
         assert type1 == QueryType.TEMPORAL
         assert type2 == QueryType.TEMPORAL
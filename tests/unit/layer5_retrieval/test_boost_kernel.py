@@ -0,0 +1,184 @@
+"""
+Tests for the Boosting Kernel
+
+Verifies the numba kernel and its NumPy fallback produce identical scores,
+both directly and through HybridRRFStrategy.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+import numpy as np
+
+from src.layer5_retrieval import _boost_numba
+from src.layer5_retrieval.strategies.hybrid_rrf import HybridRRFStrategy
+
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _random_arrays(rng, n):
+    """Random (blended, dense, temporal, trust_penalty, year_weight, category_matched)."""
+    return (
+        rng.random(n), rng.random(n), rng.random(n), rng.random(n),
+        rng.random(n) > 0.5, rng.random(n) > 0.5,
+    )
+
+
+def _numpy_reference(arrays, year_boost, category_boost, threshold, multiplicative):
+    """Scores from the NumPy fallback, for comparison with the kernel."""
+    n = len(arrays[0])
+    expected = [np.empty(n) for _ in range(3)]
+    _boost_numba._boost_numpy(
+        *arrays, year_boost, category_boost, threshold, multiplicative, *expected
+    )
+    return expected
+
+
+class TestBoostKernel:
+    """Tests for boost_scores against the NumPy fallback."""
+
+    @pytest.fixture(scope="module")
+    def candidate_arrays(self, rng):
+        """Random candidate scores and match masks."""
+        return _random_arrays(rng, 257)
+
+    @pytest.mark.parametrize("multiplicative", [True, False])
+    def test_kernel_matches_numpy_fallback(self, candidate_arrays, multiplicative):
+        """Kernel output should equal the NumPy reference in both modes."""
+        final, year_boost, category_boost = _boost_numba.boost_scores(
+            *candidate_arrays, 0.5, 0.2, 0.3, multiplicative
+        )
+
+        expected = _numpy_reference(candidate_arrays, 0.5, 0.2, 0.3, multiplicative)
+        np.testing.assert_allclose(final, expected[0])
+        np.testing.assert_array_equal(year_boost, expected[1])
+        np.testing.assert_array_equal(category_boost, expected[2])
+
+    def test_parallel_dispatch_matches_numpy_fallback(self, rng):
+        """Candidate sets above the parallel threshold produce the same scores."""
+        arrays = _random_arrays(rng, _boost_numba.PARALLEL_THRESHOLD + 1)
+
+        final, _, _ = _boost_numba.boost_scores(*arrays, 0.5, 0.2, 0.3, True)
+
+        expected = _numpy_reference(arrays, 0.5, 0.2, 0.3, True)
+        np.testing.assert_allclose(final, expected[0])
+
+    def test_no_boost_below_threshold(self, candidate_arrays):
+        """Candidates below the semantic threshold never receive a boost."""
+        dense = candidate_arrays[1]
+        _, year_boost, category_boost = _boost_numba.boost_scores(
+            *candidate_arrays, 0.5, 0.2, 0.3, True
+        )
+
+        below = dense < 0.3
+        assert not year_boost[below].any()
+        assert not category_boost[below].any()
+
+    def test_nan_dense_score_gets_no_boost(self, candidate_arrays):
+        """NaN similarities fail the threshold test instead of being boosted."""
+        blended, dense, *rest = candidate_arrays
+        dense = dense.copy()
+        dense[::3] = np.nan
+
+        final, year_boost, category_boost = _boost_numba.boost_scores(
+            blended, dense, *rest, 0.5, 0.2, 0.3, True
+        )
+
+        assert not year_boost[::3].any()
+        assert not category_boost[::3].any()
+        np.testing.assert_allclose(final[::3], (blended * rest[0] * rest[1])[::3])
+
+
+class TestStrategyBoosting:
+    """Tests that HybridRRFStrategy feeds the kernel the right inputs."""
+
+    @pytest.fixture(scope="module")
+    def strategy(self, make_chunk):
+        """Strategy over chunks from 2019-2023, without decay or trust penalties."""
+        chunks = [
+            make_chunk(
+                chunk_id=f"c{i}",
+                year=2019 + i % 5,
+                category="ai_ml" if i % 2 else "personal",
+            )
+            for i in range(20)
+        ]
+        return HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((len(chunks), 8), dtype=np.float32),
+            embedding_engine=None,
+            similarity_engine=None,
+            enable_temporal_decay=False,
+            enable_trust_filtering=False,
+        )
+
+    def test_boosted_scores_match_numpy_fallback(self, strategy, make_query_plan, rng):
+        """Strategy boosting equals the NumPy reference over its match masks."""
+        plan = make_query_plan(year_filter=2021, category_filter="ai_ml")
+        n = len(strategy.chunks)
+        idx = rng.permutation(n)
+        blended, dense, sparse = rng.random(n), rng.random(n), rng.random(n)
+
+        results = strategy._boost_candidates(idx, blended, dense, sparse, plan)
+
+        min_year, year_weights = plan.year_boost_table
+        year_weight, category_mask = strategy._match_masks(
+            min_year, year_weights, plan.category_filter
+        )
+        arrays = (
+            blended, dense, np.ones(n), np.ones(n),
+            year_weight[idx], category_mask[idx],
+        )
+        expected = _numpy_reference(
+            arrays, strategy.year_boost, strategy.category_boost,
+            strategy.semantic_threshold, strategy.scoring_mode == "blended",
+        )
+        np.testing.assert_allclose(results.final_scores, expected[0])
+        np.testing.assert_array_equal(results.year_boosts, expected[1])
+        np.testing.assert_array_equal(results.category_boosts, expected[2])
+
+
+# Calls the given kernels once, then reports the serial kernel's cache hits
+# and whether numba's thread pool was started
+_CACHE_PROBE = textwrap.dedent("""
+    import sys
+    import numpy as np
+    from numba.np.ufunc import parallel
+    from src.layer5_retrieval import _boost_numba
+
+    n = 8
+    arrays = [np.ones(n)] * 5 + [np.ones(n, dtype=bool)]
+    for name in sys.argv[1:]:
+        outs = [np.empty(n) for _ in range(3)]
+        getattr(_boost_numba, name)(*arrays, 0.5, 0.2, 0.3, True, *outs)
+
+    print(sum(_boost_numba._boost_kernel_serial._cache_hits.values()), parallel._is_initialized)
+""")
+
+
+@pytest.mark.skipif(not _boost_numba._NUMBA_AVAILABLE, reason="numba not installed")
+class TestKernelCache:
+    """Tests for the on-disk kernel cache across processes."""
+
+    def _run_probe(self, cache_dir, *kernels):
+        env = dict(os.environ, NUMBA_CACHE_DIR=str(cache_dir), PYTHONPATH=str(REPO_ROOT))
+        completed = subprocess.run(
+            [sys.executable, "-c", _CACHE_PROBE, *kernels],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        cache_hits, threads_started = completed.stdout.split()
+        return int(cache_hits), threads_started == "True"
+
+    def test_serial_kernel_does_not_load_parallel_build(self, tmp_path):
+        """With a warm cache, the serial kernel stays serial in a fresh process."""
+        self._run_probe(tmp_path, "_boost_kernel_parallel", "_boost_kernel_serial")
+
+        cache_hits, threads_started = self._run_probe(tmp_path, "_boost_kernel_serial")
+
+        assert cache_hits == 1
+        assert not threads_started
@@ -0,0 +1,118 @@
+"""
+Tests for Quantized Dense Scoring
+
+Verifies that float16/int8 embedding storage in HybridRRFStrategy keeps
+prefiltered dense retrieval consistent with full float32 precision.
+"""
+
+import pytest
+import numpy as np
+
+from src.layer5_retrieval.strategies.hybrid_rrf import HybridRRFStrategy
+
+
+N_CHUNKS = 64
+DIM = 384
+
+
+class _QueryEngine:
+    """Embedding engine stub returning a fixed query vector."""
+
+    def __init__(self, query_vec):
+        self.query_vec = query_vec
+
+    def encode_query(self, query):
+        return self.query_vec
+
+
+@pytest.fixture(scope="module")
+def chunks(make_chunk):
+    """Chunks matching the embedding matrix rows."""
+    return [
+        make_chunk(
+            chunk_id=f"chunk_{i}",
+            doc_id=f"doc_{i}",
+            text=f"Entry number {i}",
+            year=2018 + i % 5,
+            category="learning",
+        )
+        for i in range(N_CHUNKS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def embeddings(rng):
+    """Random float32 embedding matrix (read-only)."""
+    embeddings = rng.standard_normal((N_CHUNKS, DIM), dtype=np.float32)
+    embeddings.flags.writeable = False
+    return embeddings
+
+
+@pytest.fixture(scope="module")
+def make_strategy(chunks, embeddings, rng):
+    """Factory for strategies whose query lies close to chunk 5."""
+    query_engine = _QueryEngine(embeddings[5] + 0.1 * rng.standard_normal(DIM, dtype=np.float32))
+
+    def _make_strategy(embedding_dtype):
+        return HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=embeddings,
+            embedding_engine=query_engine,
+            similarity_engine=None,
+            embedding_dtype=embedding_dtype,
+        )
+    return _make_strategy
+
+
+class TestEmbeddingStorage:
+    """Tests for how embeddings are stored at each precision."""
+
+    @pytest.mark.parametrize("embedding_dtype,expected_dtype", [
+        ("float32", np.float32),
+        ("float16", np.float16),
+        ("int8", np.int8),
+    ])
+    def test_embeddings_stored_at_requested_precision(
+        self, make_strategy, embeddings, embedding_dtype, expected_dtype
+    ):
+        """Stored dense codes use the configured dtype."""
+        strategy = make_strategy(embedding_dtype)
+
+        assert strategy._dense_codes.dtype == expected_dtype
+        assert strategy._dense_codes.shape == embeddings.shape
+
+    def test_float32_keeps_a_single_embedding_matrix(self, make_strategy, embeddings):
+        """float32 mode scores straight from the caller's matrix, without a copy."""
+        strategy = make_strategy("float32")
+
+        assert strategy._dense_codes is strategy.embeddings
+        assert np.shares_memory(strategy._dense_codes, embeddings)
+
+    @pytest.mark.parametrize("embedding_dtype", ["float16", "int8"])
+    def test_quantized_modes_release_float32_embeddings(self, make_strategy, embedding_dtype):
+        """Quantized modes keep only the quantized copy."""
+        strategy = make_strategy(embedding_dtype)
+
+        assert strategy.embeddings is None
+
+    def test_unknown_embedding_dtype_raises(self, make_strategy):
+        """Unsupported dtypes are rejected at construction."""
+        with pytest.raises(ValueError):
+            make_strategy("bfloat16")
+
+
+class TestQuantizedScoring:
+    """Tests for prefiltered dense scoring on quantized embeddings."""
+
+    @pytest.mark.parametrize("embedding_dtype", ["float16", "int8"])
+    def test_quantized_scores_match_float32(self, make_strategy, embedding_dtype):
+        """Quantized similarities stay close to float32 and keep the top match."""
+        candidates = list(range(1, N_CHUNKS, 2))
+        reference = make_strategy("float32")._dense_retrieve_filtered("q", 10, candidates)
+        quantized = make_strategy(embedding_dtype)._dense_retrieve_filtered("q", 10, candidates)
+
+        assert quantized[0][0] == reference[0][0] == 5
+        ref_scores = {idx: score for idx, score, _ in reference}
+        for idx, score, _ in quantized:
+            if idx in ref_scores:
+                assert score == pytest.approx(ref_scores[idx], abs=0.02)
@@ -7,9 +7,11 @@ CRITICAL FIX: These tests verify that:
 3. Semantically irrelevant chunks don't dominate due to year boost
 """
 
+import copy
+import functools
+
 import pytest
 import numpy as np
-from unittest.mock import Mock, MagicMock
 
 from src.models.chunk import Chunk
 from src.models.query import QueryPlan, QueryType, QueryIntent, QueryFilters, QueryExpansion
@@ -21,19 +23,52 @@ from src.layer5_retrieval.strategies.hybrid_rrf import HybridRRFStrategy
 # Test Fixtures
 # =============================================================================
 
+# Query embedding handed out by the mock engine; its values are never inspected
+_FAKE_EMB = np.zeros(384, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_ai_chunk(year: int, chunk_id: str, text: str) -> Chunk:
+    """Build (once) an AI chunk for fully resolved arguments."""
+    return Chunk(
+        chunk_id=chunk_id,
+        doc_id=f"ai_doc_{year}",
+        text=text,
+        year=year,
+        category="ai_ml",
+        chunk_index=0,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_personal_chunk(year: int, chunk_id: str, text: str) -> Chunk:
+    """Build (once) a personal chunk for fully resolved arguments."""
+    return Chunk(
+        chunk_id=chunk_id,
+        doc_id=f"journal_{year}",
+        text=text,
+        year=year,
+        category="personal",
+        chunk_index=0,
+    )
+
+
+def _copy_chunk(chunk: Chunk) -> Chunk:
+    """Copy a cached chunk without recomputing its derived fields."""
+    chunk = copy.copy(chunk)
+    chunk.metadata = dict(chunk.metadata)
+    return chunk
+
 
 @pytest.fixture
 def make_ai_chunk():
     """Factory for creating AI-related chunks."""
     def _make_ai_chunk(year: int, chunk_id: str = None, text: str = None) -> Chunk:
-        return Chunk(
-            chunk_id=chunk_id or f"ai_chunk_{year}",
-            doc_id=f"ai_doc_{year}",
-            text=text or f"AI and machine learning developments in {year}. Neural networks improved.",
-            year=year,
-            category="ai_ml",
-            chunk_index=0,
-        )
+        return _copy_chunk(_cached_ai_chunk(
+            year,
+            chunk_id or f"ai_chunk_{year}",
+            text or f"AI and machine learning developments in {year}. Neural networks improved.",
+        ))
     return _make_ai_chunk
 
 
@@ -41,18 +76,15 @@ def make_ai_chunk():
 def make_personal_chunk():
     """Factory for creating personal/journal chunks (unrelated to AI)."""
     def _make_personal_chunk(year: int, chunk_id: str = None, text: str = None) -> Chunk:
-        return Chunk(
-            chunk_id=chunk_id or f"personal_chunk_{year}",
-            doc_id=f"journal_{year}",
-            text=text or f"Personal reflections from {year}. Got vaccinated today. Debugging victory.",
-            year=year,
-            category="personal",
-            chunk_index=0,
-        )
+        return _copy_chunk(_cached_personal_chunk(
+            year,
+            chunk_id or f"personal_chunk_{year}",
+            text or f"Personal reflections from {year}. Got vaccinated today. Debugging victory.",
+        ))
     return _make_personal_chunk
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plan_with_year_2021():
     """QueryPlan requesting data from 2021."""
     filters = QueryFilters(year_filter=2021, require_year_match=True)
@@ -68,21 +100,32 @@ def plan_with_year_2021():
     )
 
 
-@pytest.fixture
+class _StubEmbeddingEngine:
+    """Embedding engine stub that returns a fixed query embedding."""
+
+    def encode_query(self, query):
+        return _FAKE_EMB
+
+
+class _StubSimilarityEngine:
+    """Similarity engine stub with a built, empty index."""
+
+    is_built = True
+
+    def find_similar(self, query_embedding, k):
+        return []
+
+
+@pytest.fixture(scope="session")
 def mock_embedding_engine():
-    """Mock embedding engine that returns predictable embeddings."""
-    engine = Mock()
-    engine.encode_query = Mock(return_value=np.random.randn(384))
-    return engine
+    """Mock embedding engine that returns predictable embeddings (stateless, shared)."""
+    return _StubEmbeddingEngine()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_similarity_engine():
-    """Mock similarity engine."""
-    engine = Mock()
-    engine.is_built = True
-    engine.find_similar = Mock(return_value=[])
-    return engine
+    """Mock similarity engine (stateless, shared)."""
+    return _StubSimilarityEngine()
 
 
 # =============================================================================
@@ -112,7 +155,7 @@ class TestSemanticThresholdEnforcement:
         personal_chunk_2021 = make_personal_chunk(year=2021, text="Personal vaccine day 2021")
 
         chunks = [ai_chunk_2020, personal_chunk_2021]
-        embeddings = np.random.randn(2, 384)
+        embeddings = np.zeros((2, 384), dtype=np.float32)
 
         strategy = HybridRRFStrategy(
             chunks=chunks,
@@ -131,11 +174,11 @@ class TestSemanticThresholdEnforcement:
             1: {"rrf_score": 0.02, "dense_score": 0.15, "sparse_score": 0.01}, # Personal 2021
         }
 
-        boosted = strategy._apply_boosting(combined, plan_with_year_2021)
+        boosted = strategy.apply_boosting_indexed(combined, plan_with_year_2021)
 
         # Find the chunks in results
-        ai_result = next(c for c in boosted if c.chunk.chunk_id == ai_chunk_2020.chunk_id)
-        personal_result = next(c for c in boosted if c.chunk.chunk_id == personal_chunk_2021.chunk_id)
+        ai_result = boosted[ai_chunk_2020.chunk_id]
+        personal_result = boosted[personal_chunk_2021.chunk_id]
 
         # CRITICAL: AI chunk (semantically relevant) should rank HIGHER
         # than personal chunk (year matched but semantically irrelevant)
@@ -159,7 +202,7 @@ class TestSemanticThresholdEnforcement:
         ai_chunk_2021 = make_ai_chunk(year=2021)
 
         chunks = [ai_chunk_2020, ai_chunk_2021]
-        embeddings = np.random.randn(2, 384)
+        embeddings = np.zeros((2, 384), dtype=np.float32)
 
         strategy = HybridRRFStrategy(
             chunks=chunks,
@@ -176,10 +219,10 @@ class TestSemanticThresholdEnforcement:
             1: {"rrf_score": 0.28, "dense_score": 0.58, "sparse_score": 0.08}, # AI 2021
         }
 
-        boosted = strategy._apply_boosting(combined, plan_with_year_2021)
+        boosted = strategy.apply_boosting_indexed(combined, plan_with_year_2021)
 
-        ai_2020_result = next(c for c in boosted if c.chunk.year == 2020)
-        ai_2021_result = next(c for c in boosted if c.chunk.year == 2021)
+        ai_2020_result = boosted[ai_chunk_2020.chunk_id]
+        ai_2021_result = boosted[ai_chunk_2021.chunk_id]
 
         # 2021 chunk should be boosted and rank higher
         assert ai_2021_result.year_matched is True
@@ -207,7 +250,7 @@ class TestMultiplicativeBoosting:
         """
         chunk = make_ai_chunk(year=2021)
         chunks = [chunk]
-        embeddings = np.random.randn(1, 384)
+        embeddings = np.zeros((1, 384), dtype=np.float32)
 
         year_boost_value = 0.5
 
@@ -227,7 +270,7 @@ class TestMultiplicativeBoosting:
             0: {"rrf_score": rrf_score, "dense_score": dense_score, "sparse_score": 0.1},
         }
 
-        boosted = strategy._apply_boosting(combined, plan_with_year_2021)
+        boosted = strategy._apply_boosting_from_dict(combined, plan_with_year_2021)
         result = boosted[0]
 
         # Calculate expected multiplicative score
@@ -273,7 +316,7 @@ class TestRelevantOtherYearVsIrrelevantTargetYear:
             make_ai_chunk(year=2021, chunk_id="ai_2021", text="AI developments in 2021 were amazing"),
         ]
 
-        embeddings = np.random.randn(4, 384)
+        embeddings = np.zeros((4, 384), dtype=np.float32)
 
         strategy = HybridRRFStrategy(
             chunks=chunks,
@@ -294,19 +337,21 @@ class TestRelevantOtherYearVsIrrelevantTargetYear:
             3: {"rrf_score": 0.32, "dense_score": 0.60, "sparse_score": 0.18}, # AI 2021 - relevant
         }
 
-        boosted = strategy._apply_boosting(combined, plan_with_year_2021)
+        boosted = strategy.apply_boosting_indexed(combined, plan_with_year_2021)
 
-        # Sort by final_score (as the strategy does)
-        boosted.sort(key=lambda x: x.final_score, reverse=True)
+        # Results come back sorted by final_score
+        scores = [c.final_score for c in boosted.values()]
+        assert scores == sorted(scores, reverse=True)
 
         # Get rankings
-        ai_2021 = next(c for c in boosted if c.chunk.chunk_id == "ai_2021")
-        ai_2020 = next(c for c in boosted if c.chunk.chunk_id == "ai_2020")
-        vaccine_2021 = next(c for c in boosted if c.chunk.chunk_id == "vaccine_2021")
+        ai_2021 = boosted["ai_2021"]
+        ai_2020 = boosted["ai_2020"]
+        vaccine_2021 = boosted["vaccine_2021"]
 
         # AI 2021 should be #1 (relevant + year matched)
-        assert boosted[0].chunk.chunk_id == "ai_2021", (
-            f"AI content from 2021 should rank first, got {boosted[0].chunk.chunk_id}"
+        top_id = next(iter(boosted))
+        assert top_id == "ai_2021", (
+            f"AI content from 2021 should rank first, got {top_id}"
         )
 
         # AI 2020 should rank higher than personal 2021
@@ -315,6 +360,75 @@ class TestRelevantOtherYearVsIrrelevantTargetYear:
             f"than irrelevant vaccine from 2021 ({vaccine_2021.final_score:.3f})"
         )
 
+    def test_top_k_matches_head_of_full_ranking(
+        self,
+        make_ai_chunk,
+        make_personal_chunk,
+        mock_embedding_engine,
+        mock_similarity_engine,
+        plan_with_year_2021,
+    ):
+        """top_k should return the same leading candidates as the full boost."""
+        chunks = [
+            make_ai_chunk(year=2020, chunk_id="ai_2020", text="AI breakthroughs and neural networks in 2020"),
+            make_personal_chunk(year=2021, chunk_id="vaccine_2021", text="Got my vaccine today in 2021"),
+            make_personal_chunk(year=2021, chunk_id="debug_2021", text="Debugging victory celebration"),
+            make_ai_chunk(year=2021, chunk_id="ai_2021", text="AI developments in 2021 were amazing"),
+        ]
+
+        strategy = HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((4, 384), dtype=np.float32),
+            embedding_engine=mock_embedding_engine,
+            similarity_engine=mock_similarity_engine,
+        )
+
+        combined = {
+            0: {"rrf_score": 0.35, "dense_score": 0.65, "sparse_score": 0.2},
+            1: {"rrf_score": 0.02, "dense_score": 0.12, "sparse_score": 0.01},
+            2: {"rrf_score": 0.03, "dense_score": 0.10, "sparse_score": 0.01},
+            3: {"rrf_score": 0.32, "dense_score": 0.60, "sparse_score": 0.18},
+        }
+
+        full = [c.chunk_id for c in strategy._apply_boosting_from_dict(combined, plan_with_year_2021)]
+
+        for k in (1, 2, 4, 10):
+            top = strategy.top_k(combined, plan_with_year_2021, k)
+            assert [c.chunk_id for c in top] == full[:k]
+        assert top[0].chunk_id == "ai_2021"
+
+    def test_top_k_keeps_earliest_of_tied_candidates(
+        self,
+        make_ai_chunk,
+        mock_embedding_engine,
+        mock_similarity_engine,
+        plan_with_year_2021,
+        rng,
+    ):
+        """Ties at the k-th score are resolved like the stable full sort."""
+        chunks = [make_ai_chunk(year=2021, chunk_id=f"ai_{i}") for i in range(12)]
+
+        strategy = HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((12, 384), dtype=np.float32),
+            embedding_engine=mock_embedding_engine,
+            similarity_engine=mock_similarity_engine,
+        )
+
+        for _ in range(20):
+            # Few distinct scores so most cutoffs fall inside a tie
+            levels = rng.integers(1, 4, size=len(chunks)) / 10
+            combined = {
+                i: {"rrf_score": level, "dense_score": 0.5, "sparse_score": 0.1}
+                for i, level in enumerate(levels)
+            }
+
+            full = [c.chunk_id for c in strategy._apply_boosting_from_dict(combined, plan_with_year_2021)]
+
+            for k in range(1, len(chunks) + 1):
+                top = strategy.top_k(combined, plan_with_year_2021, k)
+                assert [c.chunk_id for c in top] == full[:k]
+
 
 class TestSemanticThresholdConfiguration:
     """Tests for semantic threshold configuration."""
@@ -332,7 +446,7 @@ class TestSemanticThresholdConfiguration:
         """
         chunk = make_personal_chunk(year=2021)
         chunks = [chunk]
-        embeddings = np.random.randn(1, 384)
+        embeddings = np.zeros((1, 384), dtype=np.float32)
 
         strategy = HybridRRFStrategy(
             chunks=chunks,
@@ -368,7 +482,7 @@ class TestNoBoostBelowThreshold:
         """
         chunk = make_personal_chunk(year=2021)
         chunks = [chunk]
-        embeddings = np.random.randn(1, 384)
+        embeddings = np.zeros((1, 384), dtype=np.float32)
 
         strategy = HybridRRFStrategy(
             chunks=chunks,
@@ -385,7 +499,7 @@ class TestNoBoostBelowThreshold:
             0: {"rrf_score": rrf_score, "dense_score": dense_score, "sparse_score": 0.01},
         }
 
-        boosted = strategy._apply_boosting(combined, plan_with_year_2021)
+        boosted = strategy._apply_boosting_from_dict(combined, plan_with_year_2021)
         result = boosted[0]
 
         # Final score should be close to rrf_score (no year boost applied)
@@ -398,3 +512,114 @@ class TestNoBoostBelowThreshold:
         assert result.year_boost < 0.01, (
             f"Year boost ({result.year_boost:.3f}) should be ~0 for chunks below threshold"
         )
+
+
+class TestBoostMaskCache:
+    """Tests that plan-level match masks are memoized across re-ranking passes."""
+
+    def test_repeated_plan_reuses_match_masks(
+        self,
+        make_ai_chunk,
+        mock_embedding_engine,
+        mock_similarity_engine,
+        plan_with_year_2021,
+    ):
+        """Boosting twice with the same plan computes the masks only once."""
+        chunks = [make_ai_chunk(year=2020), make_ai_chunk(year=2021)]
+
+        strategy = HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((2, 384), dtype=np.float32),
+            embedding_engine=mock_embedding_engine,
+            similarity_engine=mock_similarity_engine,
+        )
+
+        combined = {
+            0: {"rrf_score": 0.30, "dense_score": 0.60, "sparse_score": 0.1},
+            1: {"rrf_score": 0.28, "dense_score": 0.58, "sparse_score": 0.08},
+        }
+
+        first = strategy._apply_boosting_from_dict(combined, plan_with_year_2021)
+        second = strategy._apply_boosting_from_dict(combined, plan_with_year_2021)
+
+        info = strategy._match_masks.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert [c.final_score for c in first] == [c.final_score for c in second]
+
+
+class TestYearBoostTable:
+    """Tests for plan-level year boost weights."""
+
+    def test_table_covers_year_filter_and_range(self):
+        """Filter year and range years get full weight, gaps get none."""
+        plan = QueryPlan(
+            original_query="AI from 2019-2020 and 2022",
+            query_type=QueryType.TEMPORAL,
+            intent=QueryIntent.FACTUAL,
+            filters=QueryFilters(year_filter=2022, year_range=(2019, 2020)),
+            expansion=QueryExpansion(original_query="AI from 2019-2020 and 2022"),
+        )
+
+        assert plan.year_boost_table == (2019, (1.0, 1.0, 0.0, 1.0))
+
+    def test_range_year_chunk_gets_year_boost(
+        self,
+        make_ai_chunk,
+        mock_embedding_engine,
+        mock_similarity_engine,
+    ):
+        """Chunks inside year_range are boosted like year_filter matches."""
+        chunks = [make_ai_chunk(year=2018), make_ai_chunk(year=2019)]
+        strategy = HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((2, 384), dtype=np.float32),
+            embedding_engine=mock_embedding_engine,
+            similarity_engine=mock_similarity_engine,
+            year_boost=0.5,
+        )
+        plan = QueryPlan(
+            original_query="AI in 2019-2020",
+            query_type=QueryType.TEMPORAL,
+            intent=QueryIntent.FACTUAL,
+            filters=QueryFilters(year_range=(2019, 2020)),
+            expansion=QueryExpansion(original_query="AI in 2019-2020"),
+        )
+        combined = {
+            0: {"rrf_score": 0.30, "dense_score": 0.60, "sparse_score": 0.1},
+            1: {"rrf_score": 0.30, "dense_score": 0.60, "sparse_score": 0.1},
+        }
+
+        boosted = strategy.apply_boosting_indexed(combined, plan)
+
+        assert boosted["ai_chunk_2019"].year_matched and boosted["ai_chunk_2019"].year_boost == 0.5
+        assert not boosted["ai_chunk_2018"].year_matched and boosted["ai_chunk_2018"].year_boost == 0.0
+
+    def test_indexed_boosting_keeps_best_duplicate_chunk_id(
+        self,
+        make_ai_chunk,
+        plan_with_year_2021,
+        mock_embedding_engine,
+        mock_similarity_engine,
+    ):
+        """A chunk_id shared by several chunks maps to its best-scored chunk."""
+        chunks = [
+            make_ai_chunk(year=2018, chunk_id="ai_chunk_dup"),
+            make_ai_chunk(year=2021, chunk_id="ai_chunk_dup"),
+        ]
+        strategy = HybridRRFStrategy(
+            chunks=chunks,
+            embeddings=np.zeros((2, 384), dtype=np.float32),
+            embedding_engine=mock_embedding_engine,
+            similarity_engine=mock_similarity_engine,
+            year_boost=0.5,
+        )
+        combined = {
+            0: {"rrf_score": 0.30, "dense_score": 0.60, "sparse_score": 0.1},
+            1: {"rrf_score": 0.30, "dense_score": 0.60, "sparse_score": 0.1},
+        }
+
+        boosted = strategy.apply_boosting_indexed(combined, plan_with_year_2021)
+
+        assert list(boosted) == ["ai_chunk_dup"]
+        assert boosted["ai_chunk_dup"].chunk.year == 2021
+        assert boosted["ai_chunk_dup"].year_matched
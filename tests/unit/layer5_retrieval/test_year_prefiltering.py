@@ -10,6 +10,7 @@ import numpy as np
 from typing import List
 
 from src.models.chunk import Chunk
+from src.layer5_retrieval.prefilter import YearPrefilter
 
 
 class TestYearPrefilter:
@@ -18,14 +19,17 @@ class TestYearPrefilter:
     @pytest.fixture
     def prefilter(self, multi_year_chunks):
         """Create a YearPrefilter instance with test chunks."""
-        from src.layer5_retrieval.prefilter import YearPrefilter
         return YearPrefilter(multi_year_chunks)
 
-    @pytest.fixture
-    def embeddings(self, multi_year_chunks):
-        """Create mock embeddings for test chunks."""
+    @pytest.fixture(scope="module")
+    def embeddings(self, multi_year_chunks, rng):
+        """Create mock embeddings for test chunks (read-only, float32, C-contiguous)."""
         # Create random embeddings matching chunk count
-        return np.random.rand(len(multi_year_chunks), 384).astype(np.float32)
+        embeddings = np.ascontiguousarray(
+            rng.standard_normal((len(multi_year_chunks), 384), dtype=np.float32)
+        )
+        embeddings.setflags(write=False)
+        return embeddings
 
     # =========================================================================
     # get_candidate_indices Tests
@@ -59,7 +63,7 @@ class TestYearPrefilter:
         """Test that range includes boundary years."""
         indices = prefilter.get_candidate_indices(year_filter=2021, range_size=1)
 
-        years_found = set(multi_year_chunks[idx].year for idx in indices)
+        years_found = np.unique(prefilter.years_of(indices))
 
         # Should find 2020, 2021, 2022 (within ±1)
         # But we only have 2020, 2021, 2022, 2023 in our test data
@@ -76,8 +80,8 @@ class TestYearPrefilter:
 
         # Should find 2023 (within range)
         if len(indices) > 0:
-            years_found = set(multi_year_chunks[idx].year for idx in indices)
-            assert all(2023 <= y <= 2027 for y in years_found)
+            years_found = np.unique(prefilter.years_of(indices))
+            assert ((years_found >= 2023) & (years_found <= 2027)).all()
 
     def test_get_candidates_returns_empty_for_far_year(self, prefilter):
         """Test returns empty for year completely outside data range."""
@@ -86,6 +90,13 @@ class TestYearPrefilter:
         # Year 2030 ±2 = 2028-2032, which is outside our test data (2020-2023)
         assert len(indices) == 0
 
+    def test_years_of_matches_chunk_years(self, prefilter, multi_year_chunks):
+        """Test years_of returns the year of each indexed chunk."""
+        indices = [0, 2, 5, 7]
+        years = prefilter.years_of(indices)
+
+        assert years.tolist() == [multi_year_chunks[i].year for i in indices]
+
     def test_get_candidates_returns_list(self, prefilter):
         """Test that get_candidate_indices returns a list."""
         indices = prefilter.get_candidate_indices(year_filter=2021, range_size=2)
@@ -149,8 +160,6 @@ class TestYearPrefilterConstruction:
 
     def test_prefilter_builds_year_index(self, multi_year_chunks):
         """Test that prefilter builds internal year index."""
-        from src.layer5_retrieval.prefilter import YearPrefilter
-
         prefilter = YearPrefilter(multi_year_chunks)
 
         # Should have internal mapping
@@ -158,17 +167,21 @@ class TestYearPrefilterConstruction:
 
     def test_prefilter_handles_empty_chunks(self):
         """Test prefilter handles empty chunk list."""
-        from src.layer5_retrieval.prefilter import YearPrefilter
-
         prefilter = YearPrefilter([])
         indices = prefilter.get_candidate_indices(year_filter=2021, range_size=2)
 
         assert indices == []
 
+    def test_prefilter_handles_years_beyond_int16(self, make_chunk):
+        """Test years above 32767 are indexed without overflow."""
+        chunks = [make_chunk(chunk_id="c1", year=2021), make_chunk(chunk_id="c2", year=40000)]
+        prefilter = YearPrefilter(chunks)
+
+        assert prefilter.get_candidate_indices(year_filter=40000, range_size=0) == [1]
+        assert prefilter.years_of([0, 1]).tolist() == [2021, 40000]
+
     def test_prefilter_stores_chunks(self, multi_year_chunks):
         """Test prefilter stores reference to chunks."""
-        from src.layer5_retrieval.prefilter import YearPrefilter
-
         prefilter = YearPrefilter(multi_year_chunks)
         assert hasattr(prefilter, "chunks") or hasattr(prefilter, "_chunks")
 
@@ -178,8 +191,6 @@ class TestPrefilterPerformance:
 
     def test_prefilter_index_lookup_is_fast(self, multi_year_chunks):
         """Test that index lookup doesn't scan all chunks."""
-        from src.layer5_retrieval.prefilter import YearPrefilter
-
         prefilter = YearPrefilter(multi_year_chunks)
 
         # Should use internal index, not linear scan
@@ -5,14 +5,54 @@ TDD tests for Phase C: Answer Generation Bug Fixes.
 CRITICAL: Tests that year-matched chunks are NEVER truncated.
 """
 
+import copy
+import re
+from collections import Counter
+from typing import Tuple
+
 import pytest
-from typing import List
 
 from src.models.chunk import Chunk
-from src.models.query import QueryPlan, QueryType, QueryFilters, QueryExpansion
+from src.models.query import QueryPlan, QueryType, QueryIntent, QueryFilters, QueryExpansion
 from src.models.retrieval import ScoredChunk, RetrievalResult, RetrievalConfidence
-
-
+from src.layer6_thinking.context_builder import ContextBuilder
+
+
+_YEAR_RE = re.compile(r"Year: (20\d\d)")
+_CITE_RE = re.compile(r"\[(\d+)\]")
+
+# Citation-validity plans; tests use deep copies so the constants never change
+_PLAN_REQUIRE_YEAR_2021 = QueryPlan(
+    original_query="Test",
+    query_type=QueryType.TEMPORAL,
+    intent=QueryIntent.FACTUAL,
+    filters=QueryFilters(year_filter=2021, require_year_match=True),
+    expansion=QueryExpansion(original_query="Test"),
+)
+_PLAN_NO_YEAR = QueryPlan(
+    original_query="Test",
+    query_type=QueryType.SPECIFIC,
+    intent=QueryIntent.FACTUAL,
+    filters=QueryFilters(year_filter=None, require_year_match=False),
+    expansion=QueryExpansion(original_query="Test"),
+)
+
+# Substantial text to force truncation (~720 chars per chunk)
+_BASE_TEXT = "This is substantial content. " * 30
+
+# (chunk_id, year, text) for the truncation fixtures
+_YEAR_CHUNK_SPECS = [
+    ("c1", 2021, f"[2021-1] {_BASE_TEXT}"),
+    ("c2", 2021, f"[2021-2] {_BASE_TEXT}"),
+    ("c3", 2021, f"[2021-3] {_BASE_TEXT}"),
+    ("c4", 2020, f"[2020-1] {_BASE_TEXT}"),
+    ("c5", 2020, f"[2020-2] {_BASE_TEXT}"),
+    ("c6", 2022, f"[2022-1] {_BASE_TEXT}"),
+    ("c7", 2022, f"[2022-2] {_BASE_TEXT}"),
+]
+
+
+@pytest.mark.xdist_group(name="ctx_truncation")
 class TestYearMatchedChunksNeverTruncated:
     """
     CRITICAL: Year-matched chunks must NEVER be truncated from context.
@@ -21,31 +61,22 @@ class TestYearMatchedChunksNeverTruncated:
     year-matched chunks should always be preserved.
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def small_context_builder(self):
         """Create context builder with small limit for truncation tests."""
-        from src.layer6_thinking.context_builder import ContextBuilder
         # Very small limit to force truncation
         return ContextBuilder(max_context_length=2000)
 
-    @pytest.fixture
-    def chunks_with_years(self, make_chunk) -> List[Chunk]:
+    @pytest.fixture(scope="module")
+    def chunks_with_years(self, make_chunk) -> Tuple[Chunk, ...]:
         """Create chunks with different years."""
-        # Generate substantial text to force truncation
-        base_text = "This is substantial content. " * 30  # ~720 chars each
-
-        return [
-            make_chunk(chunk_id="c1", year=2021, text=f"[2021-1] {base_text}"),
-            make_chunk(chunk_id="c2", year=2021, text=f"[2021-2] {base_text}"),
-            make_chunk(chunk_id="c3", year=2021, text=f"[2021-3] {base_text}"),
-            make_chunk(chunk_id="c4", year=2020, text=f"[2020-1] {base_text}"),
-            make_chunk(chunk_id="c5", year=2020, text=f"[2020-2] {base_text}"),
-            make_chunk(chunk_id="c6", year=2022, text=f"[2022-1] {base_text}"),
-            make_chunk(chunk_id="c7", year=2022, text=f"[2022-2] {base_text}"),
-        ]
+        return tuple(
+            make_chunk(chunk_id=chunk_id, year=year, text=text)
+            for chunk_id, year, text in _YEAR_CHUNK_SPECS
+        )
 
-    @pytest.fixture
-    def scored_chunks_2021(self, chunks_with_years, make_scored_chunk) -> List[ScoredChunk]:
+    @pytest.fixture(scope="module")
+    def scored_chunks_2021(self, chunks_with_years, make_scored_chunk) -> Tuple[ScoredChunk, ...]:
         """Scored chunks with year matching for 2021."""
         scored = []
         for i, chunk in enumerate(chunks_with_years):
@@ -56,9 +87,9 @@ class TestYearMatchedChunksNeverTruncated:
                 final_score=0.9 - (i * 0.05),
                 rank=i,
             ))
-        return scored
+        return tuple(scored)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def retrieval_result_2021(self, scored_chunks_2021) -> RetrievalResult:
         """Retrieval result with 2021 year filter."""
         return RetrievalResult(
@@ -68,7 +99,7 @@ class TestYearMatchedChunksNeverTruncated:
             confidence=RetrievalConfidence.YEAR_MATCHED,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def query_plan_2021(self, make_query_plan) -> QueryPlan:
         """Query plan with 2021 year filter."""
         return make_query_plan(
@@ -77,35 +108,40 @@ class TestYearMatchedChunksNeverTruncated:
             year_filter=2021,
         )
 
-    def test_year_matched_chunks_never_truncated(
+    @pytest.fixture(scope="module")
+    def built(
         self,
         small_context_builder,
         retrieval_result_2021,
         query_plan_2021,
     ):
-        """CRITICAL: Year-matched chunks should NEVER be truncated."""
-        context = small_context_builder.build_context(
+        """(context, index_map) for the 2021 result, built once."""
+        return small_context_builder.build_indexed_context(
             retrieval_result_2021,
             query_plan_2021,
         )
 
-        # All 3 year-matched chunks (2021) must be present
-        # They are indexed [1], [2], [3] in the context
-        assert "[2021-1]" in context, "First 2021 chunk missing"
-        assert "[2021-2]" in context, "Second 2021 chunk missing"
-        assert "[2021-3]" in context, "Third 2021 chunk missing"
+    @pytest.fixture(scope="module")
+    def built_context(self, built) -> str:
+        """Context string for the 2021 result."""
+        return built[0]
+
+    # All 3 year-matched chunks (2021) must be present
+    # They are indexed [1], [2], [3] in the context
+    @pytest.mark.parametrize("marker", ["[2021-1]", "[2021-2]", "[2021-3]"])
+    def test_year_matched_chunks_never_truncated(self, built_context, marker):
+        """CRITICAL: Year-matched chunks should NEVER be truncated."""
+        assert marker in built_context, f"2021 chunk {marker} missing"
 
     def test_citation_indices_match_actual_context(
         self,
         small_context_builder,
+        built,
         retrieval_result_2021,
         query_plan_2021,
     ):
         """Citation indices must match chunks actually in context."""
-        context, index_map = small_context_builder.build_indexed_context(
-            retrieval_result_2021,
-            query_plan_2021,
-        )
+        context, index_map = built
 
         valid_indices = small_context_builder.get_valid_citation_indices(
             retrieval_result_2021,
@@ -113,27 +149,23 @@ class TestYearMatchedChunksNeverTruncated:
         )
 
         # Every valid citation index should be in the index map
-        for idx in valid_indices:
-            assert idx in index_map, f"Citation index {idx} not in index_map"
-            # And the chunk should actually be present in context
-            assert f"[{idx}]" in context, f"Citation [{idx}] not in context"
+        missing = next((idx for idx in valid_indices if idx not in index_map), None)
+        assert missing is None, f"Citation index {missing} not in index_map"
 
-    def test_truncation_only_affects_other_year_chunks(
-        self,
-        small_context_builder,
-        retrieval_result_2021,
-        query_plan_2021,
-    ):
+        # And the chunk should actually be present in context
+        cited = {int(m.group(1)) for m in _CITE_RE.finditer(context)}
+        absent = next((idx for idx in valid_indices if idx not in cited), None)
+        assert absent is None, f"Citation [{absent}] not in context"
+
+    def test_truncation_only_affects_other_year_chunks(self, built_context):
         """When truncation occurs, only other-year chunks should be affected."""
-        context = small_context_builder.build_context(
-            retrieval_result_2021,
-            query_plan_2021,
-        )
+        context = built_context
 
-        # Count year occurrences in context
-        year_2021_count = context.count("Year: 2021")
-        year_2020_count = context.count("Year: 2020")
-        year_2022_count = context.count("Year: 2022")
+        # Count year occurrences in context (single pass)
+        year_counts = Counter(m.group(1) for m in _YEAR_RE.finditer(context))
+        year_2021_count = year_counts["2021"]
+        year_2020_count = year_counts["2020"]
+        year_2022_count = year_counts["2022"]
 
         # All 3 year-matched chunks must be preserved
         assert year_2021_count == 3, f"Expected 3 year-2021 chunks, found {year_2021_count}"
@@ -143,100 +175,79 @@ class TestYearMatchedChunksNeverTruncated:
         total_other = year_2020_count + year_2022_count
         assert total_other < 4, "Truncation should have removed some other-year chunks"
 
-    def test_context_separates_year_matched_first(
-        self,
-        small_context_builder,
-        retrieval_result_2021,
-        query_plan_2021,
-    ):
+    @pytest.mark.parametrize("other_year", ["2020", "2022"])
+    def test_context_separates_year_matched_first(self, built_context, other_year):
         """Year-matched sources should appear before other-year sources."""
-        context = small_context_builder.build_context(
-            retrieval_result_2021,
-            query_plan_2021,
-        )
-
         # Find positions of year-matched vs other-year content
-        first_2021_pos = context.find("Year: 2021")
-        first_2020_pos = context.find("Year: 2020")
-        first_2022_pos = context.find("Year: 2022")
+        first_2021_pos = built_context.find("Year: 2021")
+        first_other_pos = built_context.find(f"Year: {other_year}")
 
         # 2021 content should come first
         assert first_2021_pos >= 0, "Should have 2021 content"
 
-        if first_2020_pos >= 0:
-            assert first_2021_pos < first_2020_pos, "2021 should come before 2020"
-
-        if first_2022_pos >= 0:
-            assert first_2021_pos < first_2022_pos, "2021 should come before 2022"
+        if first_other_pos >= 0:
+            assert first_2021_pos < first_other_pos, f"2021 should come before {other_year}"
 
 
+@pytest.mark.xdist_group(name="ctx_indexing")
 class TestIndexedContextMapping:
     """Tests for indexed context with proper citation mapping."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def context_builder(self):
         """Create standard context builder."""
-        from src.layer6_thinking.context_builder import ContextBuilder
         return ContextBuilder()
 
-    def test_build_indexed_context_returns_correct_types(
+    @pytest.fixture(scope="module")
+    def built(
         self,
         context_builder,
         retrieval_result_with_year_match,
         temporal_query_plan_2021,
     ):
-        """build_indexed_context should return (str, dict) tuple."""
-        result = context_builder.build_indexed_context(
+        """build_indexed_context output for the 2021 result, built once."""
+        return context_builder.build_indexed_context(
             retrieval_result_with_year_match,
             temporal_query_plan_2021,
         )
 
+    def test_build_indexed_context_returns_correct_types(self, built):
+        """build_indexed_context should return (str, dict) tuple."""
+        result = built
+
         assert isinstance(result, tuple)
         assert len(result) == 2
         assert isinstance(result[0], str)  # context
         assert isinstance(result[1], dict)  # index_map
 
-    def test_index_map_contains_all_context_chunks(
-        self,
-        context_builder,
-        retrieval_result_with_year_match,
-        temporal_query_plan_2021,
-    ):
+    def test_index_map_contains_all_context_chunks(self, built):
         """Index map should contain entries for all chunks in context."""
-        context, index_map = context_builder.build_indexed_context(
-            retrieval_result_with_year_match,
-            temporal_query_plan_2021,
-        )
+        context, index_map = built
 
         # Count citation markers in context
-        citation_count = sum(1 for i in range(1, 20) if f"[{i}]" in context)
+        citation_count = len({
+            int(m.group(1)) for m in _CITE_RE.finditer(context)
+            if 1 <= int(m.group(1)) < 20
+        })
 
         # Index map should have at least as many entries as citations in context
         assert len(index_map) >= citation_count
 
-    def test_index_map_values_are_chunks(
-        self,
-        context_builder,
-        retrieval_result_with_year_match,
-        temporal_query_plan_2021,
-    ):
+    def test_index_map_values_are_chunks(self, built):
         """Index map values should be Chunk objects."""
-        _, index_map = context_builder.build_indexed_context(
-            retrieval_result_with_year_match,
-            temporal_query_plan_2021,
-        )
+        _, index_map = built
 
-        for idx, chunk in index_map.items():
-            assert isinstance(chunk, Chunk), f"Index {idx} value is not a Chunk"
+        bad = next((idx for idx, chunk in index_map.items() if not isinstance(chunk, Chunk)), None)
+        assert bad is None, f"Index {bad} value is not a Chunk"
 
 
+@pytest.mark.xdist_group(name="ctx_indexing")
 class TestValidCitationIndices:
     """Tests for valid citation index calculation."""
 
     @pytest.fixture
     def context_builder(self):
-        """Create standard context builder."""
-        from src.layer6_thinking.context_builder import ContextBuilder
+        """Create a fresh context builder (valid indices reuse its last build)."""
         return ContextBuilder()
 
     def test_valid_indices_with_year_filter_only_year_matched(
@@ -245,18 +256,9 @@ class TestValidCitationIndices:
         retrieval_result_with_year_match,
     ):
         """With year filter and require_year_match, only year-matched indices valid."""
-        # Create plan that requires year match
-        plan = QueryPlan(
-            original_query="Test",
-            query_type=QueryType.TEMPORAL,
-            intent=pytest.importorskip("src.models.query").QueryIntent.FACTUAL,
-            filters=QueryFilters(year_filter=2021, require_year_match=True),
-            expansion=QueryExpansion(original_query="Test"),
-        )
-
         valid_indices = context_builder.get_valid_citation_indices(
             retrieval_result_with_year_match,
-            plan,
+            copy.deepcopy(_PLAN_REQUIRE_YEAR_2021),
         )
 
         # Should only include year-matched chunks
@@ -272,27 +274,19 @@ class TestValidCitationIndices:
         """Without year filter, all indices should be valid."""
         result = make_retrieval_result(year_filter=None)
 
-        plan = QueryPlan(
-            original_query="Test",
-            query_type=QueryType.SPECIFIC,
-            intent=pytest.importorskip("src.models.query").QueryIntent.FACTUAL,
-            filters=QueryFilters(year_filter=None, require_year_match=False),
-            expansion=QueryExpansion(original_query="Test"),
-        )
-
-        valid_indices = context_builder.get_valid_citation_indices(result, plan)
+        valid_indices = context_builder.get_valid_citation_indices(result, copy.deepcopy(_PLAN_NO_YEAR))
 
         # All indices should be valid
         assert len(valid_indices) == len(result.candidates)
 
 
+@pytest.mark.xdist_group(name="ctx_edge_cases")
 class TestContextBuilderEdgeCases:
     """Edge case tests for context builder."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def context_builder(self):
         """Create standard context builder."""
-        from src.layer6_thinking.context_builder import ContextBuilder
         return ContextBuilder()
 
     def test_empty_candidates_returns_empty_string(
@@ -5,33 +5,42 @@ TDD tests for Phase D: Iterative Optimization.
 Tests gap-aware retrieval (IRCoT-style) when coverage gaps detected.
 """
 
+import copy
 import pytest
 from typing import List
 
 from src.models.retrieval import RetrievalResult, RetrievalConfidence
 from src.config import MNEMEConfig
+from src.layer6_thinking.gap_enforcer import GapEnforcer
 
 
+@pytest.fixture(scope="module")
+def testing_config() -> MNEMEConfig:
+    """Test configuration, built (and env-parsed) once per module."""
+    return MNEMEConfig.for_testing()
+
+
+@pytest.mark.xdist_group(name="gap_enforcer")
 class TestGapEnforcer:
     """Tests for GapEnforcer class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def enforcer(self):
         """Create a GapEnforcer instance."""
-        from src.layer6_thinking.gap_enforcer import GapEnforcer
         return GapEnforcer()
 
-    @pytest.fixture
-    def config_with_iterative(self):
+    @pytest.fixture(scope="module")
+    def config_with_iterative(self, testing_config):
         """Config with iterative retrieval enabled."""
-        config = MNEMEConfig.for_testing()
+        # copy.copy skips __post_init__, so env overrides are not re-applied
+        config = copy.copy(testing_config)
         config.enable_iterative_retrieval = True
         return config
 
-    @pytest.fixture
-    def config_without_iterative(self):
+    @pytest.fixture(scope="module")
+    def config_without_iterative(self, testing_config):
         """Config with iterative retrieval disabled."""
-        config = MNEMEConfig.for_testing()
+        config = copy.copy(testing_config)
         config.enable_iterative_retrieval = False
         return config
 
@@ -39,103 +48,89 @@ class TestGapEnforcer:
     # should_warn_about_gaps Tests
     # =========================================================================
 
-    def test_should_warn_when_year_gap(self, enforcer):
-        """Should warn when specific year gap detected."""
-        gaps = ["No documents from 2021 matched."]
-        assert enforcer.should_warn_about_gaps(gaps) is True
-
-    def test_should_warn_when_missing_years_gap(self, enforcer):
-        """Should warn when missing years detected."""
-        gaps = ["Missing years: [2021, 2022]"]
-        assert enforcer.should_warn_about_gaps(gaps) is True
-
-    def test_no_warning_for_empty_gaps(self, enforcer):
-        """No warning when gaps list is empty."""
-        gaps = []
-        assert enforcer.should_warn_about_gaps(gaps) is False
-
-    def test_no_warning_for_minor_synthesis_gaps(self, enforcer):
-        """No warning for minor synthesis coverage gaps."""
-        gaps = ["Limited coverage. Missing: [2019]"]
+    @pytest.mark.parametrize("gaps,expected", [
+        (["No documents from 2021 matched."], True),
+        (["Missing years: [2021, 2022]"], True),
+        ([], False),
         # Minor gaps shouldn't trigger warnings
-        assert enforcer.should_warn_about_gaps(gaps) is False
-
-    def test_should_warn_for_critical_category_gap(self, enforcer):
-        """Should warn when critical category is missing."""
-        gaps = ["No documents from category 'ai_ml' found."]
-        assert enforcer.should_warn_about_gaps(gaps) is True
+        (["Limited coverage. Missing: [2019]"], False),
+        (["No documents from category 'ai_ml' found."], True),
+    ], ids=[
+        "year_gap",
+        "missing_years_gap",
+        "empty_gaps",
+        "minor_synthesis_gap",
+        "critical_category_gap",
+    ])
+    def test_should_warn_about_gaps(self, enforcer, gaps, expected):
+        """Warn on year, missing-year and category gaps; not on minor ones."""
+        assert enforcer.should_warn_about_gaps(gaps) is expected
 
     # =========================================================================
     # get_gap_warning_prompt Tests
     # =========================================================================
 
-    def test_get_gap_warning_prompt_returns_string(self, enforcer):
-        """Warning prompt should be a string."""
-        gaps = ["No documents from 2021 matched."]
-        prompt = enforcer.get_gap_warning_prompt(gaps)
-        assert isinstance(prompt, str)
-
-    def test_get_gap_warning_prompt_contains_gap_info(self, enforcer):
-        """Warning prompt should contain gap information."""
-        gaps = ["No documents from 2021 matched."]
-        prompt = enforcer.get_gap_warning_prompt(gaps)
-        assert "2021" in prompt
-
-    def test_get_gap_warning_prompt_empty_gaps(self, enforcer):
-        """Warning prompt for empty gaps is empty."""
-        gaps = []
+    @pytest.mark.parametrize("gaps,expected_terms", [
+        (["No documents from 2021 matched."], ["2021"]),
+        # Empty gaps give an empty prompt
+        ([], None),
+        (["Missing years: [2021]", "Missing category: [nlp]"], ["2021", "nlp"]),
+    ], ids=["single_gap", "empty_gaps", "multiple_gaps"])
+    def test_get_gap_warning_prompt(self, enforcer, gaps, expected_terms):
+        """Warning prompt is a string mentioning at least one gap."""
         prompt = enforcer.get_gap_warning_prompt(gaps)
-        assert prompt == "" or len(prompt) == 0
 
-    def test_get_gap_warning_prompt_multiple_gaps(self, enforcer):
-        """Warning prompt handles multiple gaps."""
-        gaps = ["Missing years: [2021]", "Missing category: [nlp]"]
-        prompt = enforcer.get_gap_warning_prompt(gaps)
-        assert "2021" in prompt or "nlp" in prompt
+        assert isinstance(prompt, str)
+        if expected_terms is None:
+            assert prompt == ""
+        else:
+            assert any(term in prompt for term in expected_terms)
 
     # =========================================================================
     # should_trigger_iterative_retrieval Tests
     # =========================================================================
 
-    def test_trigger_iterative_when_enabled_and_gaps(self, enforcer, config_with_iterative):
-        """Should trigger iterative retrieval when enabled and gaps exist."""
-        gaps = ["Missing years: [2019, 2020]", "Missing category: [nlp]"]
-        assert enforcer.should_trigger_iterative_retrieval(gaps, config_with_iterative) is True
-
-    def test_no_trigger_when_disabled(self, enforcer, config_without_iterative):
-        """Should not trigger iterative retrieval when disabled."""
-        gaps = ["Missing years: [2019, 2020]", "Missing category: [nlp]"]
-        assert enforcer.should_trigger_iterative_retrieval(gaps, config_without_iterative) is False
-
-    def test_no_trigger_when_no_gaps(self, enforcer, config_with_iterative):
-        """Should not trigger iterative retrieval when no gaps."""
-        gaps = []
-        assert enforcer.should_trigger_iterative_retrieval(gaps, config_with_iterative) is False
-
-    def test_no_trigger_for_single_minor_gap(self, enforcer, config_with_iterative):
-        """Should not trigger for single minor gap."""
-        gaps = ["Limited coverage."]
-        assert enforcer.should_trigger_iterative_retrieval(gaps, config_with_iterative) is False
-
-    def test_trigger_for_synthesis_with_multiple_gaps(self, enforcer, config_with_iterative):
-        """Should trigger for synthesis queries with multiple significant gaps."""
-        gaps = ["Missing years: [2019, 2020, 2021]", "Missing categories: [nlp, cv]"]
-        assert enforcer.should_trigger_iterative_retrieval(gaps, config_with_iterative) is True
-
-
+    @pytest.mark.parametrize("config_fixture,gaps,expected", [
+        ("config_with_iterative", ["Missing years: [2019, 2020]", "Missing category: [nlp]"], True),
+        ("config_without_iterative", ["Missing years: [2019, 2020]", "Missing category: [nlp]"], False),
+        ("config_with_iterative", [], False),
+        ("config_with_iterative", ["Limited coverage."], False),
+        ("config_with_iterative", ["Missing years: [2019, 2020, 2021]", "Missing categories: [nlp, cv]"], True),
+    ], ids=[
+        "enabled_with_gaps",
+        "disabled",
+        "no_gaps",
+        "single_minor_gap",
+        "synthesis_multiple_gaps",
+    ])
+    def test_should_trigger_iterative_retrieval(self, request, enforcer, config_fixture, gaps, expected):
+        """Trigger only when enabled and significant gaps exist."""
+        config = request.getfixturevalue(config_fixture)
+        assert enforcer.should_trigger_iterative_retrieval(gaps, config) is expected
+
+
+@pytest.mark.xdist_group(name="gap_integration")
 class TestGapEnforcerIntegration:
     """Integration tests for GapEnforcer with retrieval results."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def enforcer(self):
         """Create a GapEnforcer instance."""
-        from src.layer6_thinking.gap_enforcer import GapEnforcer
         return GapEnforcer()
 
+    @pytest.fixture(scope="module")
+    def base_result(self, make_retrieval_result) -> RetrievalResult:
+        """Base retrieval result the gap fixtures copy."""
+        result = make_retrieval_result()
+        # Shallow copies share the candidates, so freeze them
+        result.candidates = tuple(result.candidates)
+        return result
+
     @pytest.fixture
-    def result_with_gaps(self, make_retrieval_result) -> RetrievalResult:
+    def result_with_gaps(self, base_result) -> RetrievalResult:
         """Retrieval result with coverage gaps."""
-        result = make_retrieval_result(year_filter=2021)
+        result = copy.copy(base_result)
+        result.year_filter = 2021
         result.coverage_gaps = [
             "No documents from 2021 matched.",
             "Missing category: [nlp]",
@@ -144,9 +139,9 @@ class TestGapEnforcerIntegration:
         return result
 
     @pytest.fixture
-    def result_without_gaps(self, make_retrieval_result) -> RetrievalResult:
+    def result_without_gaps(self, base_result) -> RetrievalResult:
         """Retrieval result without coverage gaps."""
-        result = make_retrieval_result()
+        result = copy.copy(base_result)
         result.coverage_gaps = []
         result.missing_years = []
         return result
@@ -173,13 +168,13 @@ class TestGapEnforcerIntegration:
         # Should suggest expanding year range or relaxing filters
 
 
+@pytest.mark.xdist_group(name="gap_classification")
 class TestGapClassification:
     """Tests for gap classification and severity."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def enforcer(self):
         """Create a GapEnforcer instance."""
-        from src.layer6_thinking.gap_enforcer import GapEnforcer
         return GapEnforcer()
 
     def test_classify_year_gap_as_critical(self, enforcer):